@@ -1,5 +1,6 @@
 """GEE RedList Python - Tools for IUCN Red List analysis using Google Earth Engine."""
 
+from importlib import import_module
 from importlib.metadata import version, PackageNotFoundError
 
 # Get version from installed package metadata (reads from pyproject.toml)
@@ -9,17 +10,55 @@ except PackageNotFoundError:
     # Package not installed (development mode)
     __version__ = "0.0.0.dev"
 
-from gee_redlist.ee_auth import check_authentication, is_authenticated, print_authentication_status
-from gee_redlist.ee_rle import make_eoo, area_km2
-from gee_redlist.map import create_country_map, get_utm_epsg
+# Public functions are imported on first access (PEP 562) so that importing the
+# package does not pull in Earth Engine, matplotlib and cartopy up front.
+_LAZY_IMPORTS = {
+    "check_authentication": "gee_redlist.ee_auth",
+    "invalidate_authentication_cache": "gee_redlist.ee_auth",
+    "is_authenticated": "gee_redlist.ee_auth",
+    "print_authentication_status": "gee_redlist.ee_auth",
+    "make_eoo": "gee_redlist.ee_rle",
+    "area_km2": "gee_redlist.ee_rle",
+    "make_eoo_many": "gee_redlist.ee_rle",
+    "make_eoo_cached": "gee_redlist.ee_rle",
+    "make_eoo_by_class": "gee_redlist.ee_rle",
+    "area_km2_many": "gee_redlist.ee_rle",
+    "eoo_areas_km2": "gee_redlist.ee_rle",
+    "create_country_map": "gee_redlist.map",
+    "create_country_maps": "gee_redlist.map",
+    "get_utm_epsg": "gee_redlist.map",
+    "get_utm_epsg_many": "gee_redlist.map",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "__version__",
     "check_authentication",
+    "invalidate_authentication_cache",
     "is_authenticated",
     "print_authentication_status",
     "make_eoo",
     "area_km2",
+    "make_eoo_many",
+    "make_eoo_cached",
+    "make_eoo_by_class",
+    "area_km2_many",
+    "eoo_areas_km2",
     "create_country_map",
+    "create_country_maps",
     "get_utm_epsg",
+    "get_utm_epsg_many",
 ]
@@ -1,47 +1,150 @@
 """Earth Engine authentication utilities."""
 
-import ee
-from google.auth import default
+import sys
+import threading
 
+# ee and google.auth are imported inside the functions that use them, so that
+# importing this module (e.g. for the CLI) does not pay their import cost.
 
-def initialize_ee(project: str):
+# Results of successful check_authentication() calls keyed by resolve_project,
+# reused for the lifetime of the process until invalidate_authentication_cache()
+# is called.
+_AUTH_CACHE: dict[bool, dict] = {}
+_AUTH_LOCK = threading.Lock()
+
+# Whether ee.Initialize() has already succeeded in this process.
+_EE_INITIALIZED = False
+
+# Earth Engine endpoint for high volume (batch) workloads. It allows more
+# concurrent requests than the default endpoint, but does not cache results
+# between requests.
+_HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+# Instructions printed by print_authentication_status() when authentication fails.
+_AUTH_HELP_TEXT = (
+    "\nTo authenticate, run:\n"
+    "  earthengine authenticate\n"
+    "Or use service account authentication with:\n"
+    "  ee.Initialize(credentials=ee.ServiceAccountCredentials(email, key_file))"
+)
+
+
+def initialize_ee(project: str, high_volume: bool = False):
     """Initialize Earth Engine.
 
     Args:
         project: The Earth Engine project to initialize.
+        high_volume: If True, use the high volume endpoint. Recommended for
+                     batch runs that send many concurrent requests (e.g.
+                     make_eoo_many() or download_fractional_coverage_many()
+                     over many species or ecosystems). Default is False.
 
     Returns:
         None
     """
+    import ee
+    from google.auth import default
+
     credentials, _ = default(scopes=[
         'https://www.googleapis.com/auth/earthengine',
         'https://www.googleapis.com/auth/cloud-platform'
     ])
-    ee.Initialize(credentials=credentials, project=project)
+    opt_url = _HIGH_VOLUME_URL if high_volume else None
+    global _EE_INITIALIZED
+    with _AUTH_LOCK:
+        ee.Initialize(credentials=credentials, project=project, opt_url=opt_url)
+        # New credentials may change the authentication result
+        _AUTH_CACHE.clear()
+        _EE_INITIALIZED = True
+
+
+def invalidate_authentication_cache() -> None:
+    """
+    Forget the cached authentication result.
+
+    Call this after changing credentials (e.g. after ``ee.Reset()`` or
+    ``earthengine authenticate``) so the next check_authentication() call
+    probes Earth Engine again.
+    """
+    global _EE_INITIALIZED
+    with _AUTH_LOCK:
+        _AUTH_CACHE.clear()
+        _EE_INITIALIZED = False
+
+
+def _initialize_once() -> None:
+    """Call ee.Initialize() unless it has already succeeded in this process."""
+    global _EE_INITIALIZED
+    if not _EE_INITIALIZED:
+        import ee
+        ee.Initialize()
+        _EE_INITIALIZED = True
 
 
-def check_authentication() -> dict[str, bool | str]:
+def check_authentication(resolve_project: bool = False) -> dict[str, bool | str]:
     """
     Test authentication to the Earth Engine Python API.
 
+    Credentials are verified with a single cheap computation. The project ID
+    requires an extra request to list asset roots, so it is only looked up
+    when resolve_project is True.
+
+    A successful result is cached for the lifetime of the process, so repeated
+    calls do not make further network requests. Failed results are not cached.
+    Use invalidate_authentication_cache() to force a new check.
+
+    Only Earth Engine and Google authentication errors are reported as a
+    failed check; any other exception is raised to the caller.
+
+    Args:
+        resolve_project: Whether to look up the authenticated project ID.
+                         Default is False.
+
     Returns:
         dict: A dictionary containing:
             - 'authenticated' (bool): Whether authentication was successful
             - 'message' (str): A descriptive message about the authentication status
             - 'project' (str | None): The authenticated project ID if available
+              (always None unless resolve_project is True)
 
     Examples:
-        >>> result = check_authentication()
+        >>> result = check_authentication(resolve_project=True)
         >>> if result['authenticated']:
         ...     print(f"Authenticated with project: {result['project']}")
         ... else:
         ...     print(f"Authentication failed: {result['message']}")
     """
+    with _AUTH_LOCK:
+        # A cached result with the project resolved also answers a plain check
+        for key in ((True,) if resolve_project else (False, True)):
+            if key in _AUTH_CACHE:
+                return dict(_AUTH_CACHE[key])
+
+        result = _check_authentication_uncached(resolve_project)
+        if result['authenticated']:
+            _AUTH_CACHE[resolve_project] = result
+        return dict(result)
+
+
+def _check_authentication_uncached(resolve_project: bool) -> dict[str, bool | str]:
+    """Probe Earth Engine authentication without consulting the cache."""
+    import ee
+    from google.auth.exceptions import GoogleAuthError
+
     try:
         # Try to initialize Earth Engine
-        ee.Initialize()
+        _initialize_once()
 
         # If we get here, initialization succeeded
+        if not resolve_project:
+            # Evaluate a constant to verify the credentials in one round trip
+            ee.Number(1).getInfo()
+            return {
+                'authenticated': True,
+                'message': 'Successfully authenticated to Earth Engine',
+                'project': None
+            }
+
         # Try to get the current project
         try:
             # Attempt a simple operation to verify authentication works
@@ -51,16 +154,13 @@ def check_authentication() -> dict[str, bool | str]:
                 # Extract project ID from the first asset root
                 # Asset roots look like: [{'id': 'projects/my-project', ...}]
                 root_id = asset_roots[0].get('id', '')
-                if root_id.startswith('projects/'):
-                    project_id = root_id.split('/', 1)[1]
-                else:
-                    project_id = root_id
+                project_id = root_id.removeprefix('projects/') if root_id else None
             return {
                 'authenticated': True,
                 'message': 'Successfully authenticated to Earth Engine',
                 'project': project_id
             }
-        except Exception as e:
+        except (ee.EEException, GoogleAuthError) as e:
             # Initialization succeeded but we can't get project info
             return {
                 'authenticated': True,
@@ -76,8 +176,10 @@ def check_authentication() -> dict[str, bool | str]:
             'project': None
         }
 
-    except Exception as e:
-        # Generic exception
+    except GoogleAuthError as e:
+        # Missing, invalid or unrefreshable Google credentials
+        # (other exceptions are bugs rather than authentication failures and
+        # are left to propagate)
         return {
             'authenticated': False,
             'message': f'Authentication error: {str(e)}',
@@ -89,6 +191,9 @@ def is_authenticated() -> bool:
     """
     Check if Earth Engine is authenticated.
 
+    The project ID is not looked up, and a previously cached successful check
+    (with or without the project) is reused without any network request.
+
     Returns:
         bool: True if authenticated, False otherwise
 
@@ -108,17 +213,21 @@ def print_authentication_status() -> None:
 
     This is useful for debugging and CLI usage.
     """
-    result = check_authentication()
+    result = check_authentication(resolve_project=True)
 
     if result['authenticated']:
-        print(f"✓ Earth Engine Authentication: SUCCESS")
-        print(f"  Message: {result['message']}")
+        lines = [
+            "✓ Earth Engine Authentication: SUCCESS",
+            f"  Message: {result['message']}",
+        ]
         if result['project']:
-            print(f"  Project: {result['project']}")
+            lines.append(f"  Project: {result['project']}")
     else:
-        print(f"✗ Earth Engine Authentication: FAILED")
-        print(f"  Message: {result['message']}")
-        print(f"\nTo authenticate, run:")
-        print(f"  earthengine authenticate")
-        print(f"Or use service account authentication with:")
-        print(f"  ee.Initialize(credentials=ee.ServiceAccountCredentials(email, key_file))")
+        lines = [
+            "✗ Earth Engine Authentication: FAILED",
+            f"  Message: {result['message']}",
+            _AUTH_HELP_TEXT,
+        ]
+
+    # Write the whole report at once rather than one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -5,10 +5,37 @@ This module provides functions for calculating spatial metrics used in
 IUCN Red List of Ecosystems assessments, including Extent of Occurrence (EOO).
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
 from typing import Optional
 import yaml
 
 import ee
+import requests
+
+
+# WKT of ESRI:54034 (World Cylindrical Equal Area), the AOO grid projection
+_WKT_54034 = """
+    PROJCS["World_Cylindrical_Equal_Area",
+        GEOGCS["WGS 84",
+            DATUM["WGS_1984",
+                SPHEROID["WGS 84",6378137,298.257223563,
+                    AUTHORITY["EPSG","7030"]],
+                AUTHORITY["EPSG","6326"]],
+            PRIMEM["Greenwich",0],
+            UNIT["Degree",0.0174532925199433]],
+        PROJECTION["Cylindrical_Equal_Area"],
+        PARAMETER["standard_parallel_1",0],
+        PARAMETER["central_meridian",0],
+        PARAMETER["false_easting",0],
+        PARAMETER["false_northing",0],
+        UNIT["metre",1,
+            AUTHORITY["EPSG","9001"]],
+        AXIS["Easting",EAST],
+        AXIS["Northing",NORTH],
+        AUTHORITY["ESRI","54034"]]
+"""
 
 
 def load_yaml(yaml_path):
@@ -17,6 +44,7 @@ def load_yaml(yaml_path):
         return yaml.safe_load(f)
 
 
+@functools.lru_cache(maxsize=1)
 def get_aoo_grid_projection() -> ee.Projection:
     """
     Returns the default projection to use for the AOO grid in RLE Assessments.
@@ -25,43 +53,92 @@ def get_aoo_grid_projection() -> ee.Projection:
     is used based on the grid defined in the document:
     `Global 10 x 10-km grids suitable for use in IUCN Red List of Ecosystems assessments`
     available at: https://www.iucnrle.org/rle-material-and-tools
-    """
 
-    wkt1 = """
-        PROJCS["World_Cylindrical_Equal_Area",
-            GEOGCS["WGS 84",
-                DATUM["WGS_1984",
-                    SPHEROID["WGS 84",6378137,298.257223563,
-                        AUTHORITY["EPSG","7030"]],
-                    AUTHORITY["EPSG","6326"]],
-                PRIMEM["Greenwich",0],
-                UNIT["Degree",0.0174532925199433]],
-            PROJECTION["Cylindrical_Equal_Area"],
-            PARAMETER["standard_parallel_1",0],
-            PARAMETER["central_meridian",0],
-            PARAMETER["false_easting",0],
-            PARAMETER["false_northing",0],
-            UNIT["metre",1,
-                AUTHORITY["EPSG","9001"]],
-            AXIS["Easting",EAST],
-            AXIS["Northing",NORTH],
-            AUTHORITY["ESRI","54034"]]
+    The projection is built once and reused by later calls.
     """
+
     scale = 1e4
     proj = ee.Projection(
-        crs=wkt1,
+        crs=_WKT_54034,
         transform=[scale, 0, 0, 0, scale, 0]
     )
     return proj
 
 
+def _graph_cache_key(value):
+    """Return a hashable cache key for an argument of an Earth Engine function."""
+    serialize = getattr(value, 'serialize', None)
+    if callable(serialize):
+        # ee.ComputedObject.serialize() is a stable encoding of the deferred graph
+        return serialize()
+    if isinstance(value, list):
+        return tuple(_graph_cache_key(v) for v in value)
+    return value
+
+
+class _GraphCall:
+    """The arguments of a call, hashed and compared by their graph cache key."""
+
+    __slots__ = ('key', 'args', 'kwargs')
+
+    def __init__(self, key, args, kwargs):
+        self.key = key
+        self.args = args
+        self.kwargs = kwargs
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, _GraphCall) and self.key == other.key
+
+
+def _memoize_by_graph(maxsize: int = 128):
+    """
+    Memoize a function that builds Earth Engine objects.
+
+    Calls are keyed on the serialized graphs of Earth Engine arguments and the
+    values of all other arguments, so repeated calls with equivalent inputs
+    return the same object without rebuilding it (or repeating any getInfo()
+    calls made while building it). At most maxsize results are kept, least
+    recently used first out. Use func.cache_clear() to empty the cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.lru_cache(maxsize=maxsize)
+        def cached_call(call):
+            return func(*call.args, **call.kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                (name, _graph_cache_key(value))
+                for name, value in bound.arguments.items()
+            )
+            return cached_call(_GraphCall(key, args, kwargs))
+
+        wrapper.cache_clear = cached_call.cache_clear
+        wrapper.cache_info = cached_call.cache_info
+        return wrapper
+
+    return decorator
+
+
+@_memoize_by_graph(maxsize=128)
 def make_eoo(
     class_img: ee.Image,
     geo: ee.Geometry = None,
     scale: int = None,
     max_pixels: int = 1e12,
     max_error: int = 1,
-    best_effort: bool = False
+    best_effort: bool = False,
+    method: str = 'points',
+    tile_scale: int = 4,
+    crs: str | None = None,
+    crs_transform: list | None = None,
 ) -> ee.Geometry:
     """
     Calculate the Extent of Occurrence (EOO) polygon from a binary image.
@@ -100,6 +177,23 @@ def make_eoo(
                    Default is 1.
         best_effort: If True, uses best effort mode which may be less accurate
                      but more likely to succeed for large areas. Default is False.
+        method: How presence pixels are reduced before the hull is taken.
+                'points' (default) keeps only the westernmost and easternmost
+                presence pixel of each pixel row, which are the only pixels that
+                can lie on the hull, and hulls them server-side. 'qhull' fetches
+                the same points with one getInfo() and hulls them locally with
+                scipy's Qhull. 'vectors' traces every presence region with
+                reduceToVectors and takes the hull of the resulting polygons.
+        tile_scale: Scaling factor used to split the reduction into smaller
+                    tiles, trading memory per worker for parallelism.
+                    Default is 4.
+        crs: The projection to vectorize in, e.g. the class image's own CRS
+             fetched once and reused across calls. Only supported by the
+             'vectors' method. Default is 'EPSG:4326'.
+        crs_transform: The affine transform of the vectorization grid. When
+                       given, it is used instead of scale and the image's
+                       nominal scale is not requested. Only supported by the
+                       'vectors' method.
 
     Returns:
         An ee.Geometry representing the convex hull (EOO polygon) of all
@@ -117,36 +211,291 @@ def make_eoo(
         The input image should be a binary classification where:
         - Value 1 indicates presence (included in EOO)
         - Value 0 or masked indicates absence (excluded from EOO)
+
+        The 'points' and 'qhull' methods build the hull from pixel centres, so
+        its outline lies up to half a pixel inside the hull produced by the
+        'vectors' method.
+
+        Results are cached on the serialized image and geometry together with
+        the other arguments, so repeated calls return the same ee.Geometry.
+        The 128 most recently used results are kept; call
+        make_eoo.cache_clear() to empty the cache.
     """
+    if method not in ('points', 'qhull', 'vectors'):
+        raise ValueError(
+            f"method must be 'points', 'qhull' or 'vectors', got {method!r}"
+        )
+    if method != 'vectors' and (crs is not None or crs_transform is not None):
+        raise ValueError("crs and crs_transform are only supported by method='vectors'")
 
     if geo is None:
         geo = class_img.geometry()
 
     # Set the scale (in meters) for reducing the image pixels to polygons.
     # Use the image's nominal scale unless is is less than 50 meters per pixel.
+    # An explicit crs_transform already fixes the grid, so no scale is needed.
+    if scale is None and crs_transform is None:
+        scale = max(class_img.projection().nominalScale().getInfo(), 50)
+
+    if method == 'vectors':
+        # EE rejects scale and crsTransform together, so pass only one of them
+        if crs_transform is not None:
+            grid = {'crsTransform': crs_transform}
+        else:
+            grid = {'scale': scale}
+
+        # Mask out absence pixels (value = 0) so only presence regions are
+        # traced, then reduce to vectors to get all polygons
+        return (
+            class_img
+            .selfMask()
+            .reduceToVectors(
+                **grid,
+                crs=crs or 'EPSG:4326',
+                geometry=geo,
+                geometryType='polygon',
+                maxPixels=max_pixels,
+                bestEffort=best_effort,
+                tileScale=tile_scale,
+            )
+            .geometry()
+            .convexHull(maxError=max_error)
+            # convexHull() is called twice as a workaround for a bug
+            # (https://issuetracker.google.com/issues/465490917)
+            .convexHull(maxError=max_error)
+        )
+
+    points = _presence_row_extremes(
+        class_img, geo, scale, max_pixels, best_effort, tile_scale
+    )
+
+    if method == 'qhull':
+        return _convex_hull_client_side(points.getInfo(), max_error)
+
+    # The row extremes are longitude/latitude pairs, so build the point set in
+    # EPSG:4326 explicitly rather than relying on the default projection.
+    return (
+        ee.Geometry.MultiPoint(points, proj='EPSG:4326')
+        .convexHull(maxError=max_error)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _make_eoo_by_key(call: _GraphCall) -> ee.Geometry:
+    """make_eoo_cached() results keyed by the caller's key and the other arguments."""
+    # Bypass make_eoo()'s own memoization, which would serialize the inputs
+    return make_eoo.__wrapped__(*call.args, **call.kwargs)
+
+
+def make_eoo_cached(
+    key: str,
+    class_img: ee.Image,
+    geo: ee.Geometry = None,
+    **kwargs,
+) -> ee.Geometry:
+    """
+    Calculate the EOO polygon, memoized on a caller-supplied key.
+
+    make_eoo() already memoizes on the serialized image and geometry, but
+    serializing a large graph has a cost of its own. When the caller has a
+    stable identifier for the input (e.g. a species or ecosystem ID), this
+    function skips serialization and looks the result up by that key and the
+    remaining arguments.
+
+    Args:
+        key: A string that uniquely identifies class_img and geo.
+        class_img: A binary ee.Image where pixels with value 1 represent presence.
+        geo: The geometry to use for the reduction. If not provided, the
+             geometry will be inferred from the class_img.
+        **kwargs: Additional keyword arguments passed to make_eoo().
+
+    Returns:
+        An ee.Geometry representing the EOO polygon.
+
+    Example:
+        >>> eoo = make_eoo_cached('mm_ecosys_37', ecosystems.eq(37))
+        >>> area_km2(eoo).getInfo()
+
+    Note:
+        The 128 most recently used results are kept. Call
+        make_eoo_cached.cache_clear() to empty the cache, e.g. after the data
+        behind a key has changed.
+    """
+    cache_key = (key,) + tuple(
+        (name, _graph_cache_key(value)) for name, value in sorted(kwargs.items())
+    )
+    return _make_eoo_by_key(_GraphCall(cache_key, (class_img, geo), kwargs))
+
+
+make_eoo_cached.cache_clear = _make_eoo_by_key.cache_clear
+
+
+def make_eoo_by_class(
+    class_img: ee.Image,
+    labels: list[int],
+    geo: ee.Geometry = None,
+    scale: int = None,
+    max_pixels: int = 1e12,
+    max_error: int = 1,
+    best_effort: bool = False,
+    method: str = 'points',
+    tile_scale: int = 4,
+) -> ee.Dictionary:
+    """
+    Calculate the EOO polygons of several classes of a multi-class image.
+
+    Instead of calling make_eoo() once per class, the hulls of all classes are
+    built in a single server-side graph, so a single getInfo() on the result,
+    or on values derived from it, evaluates all classes in one request.
+
+    Args:
+        class_img: A single-band ee.Image of integer class labels.
+        labels: The class labels to compute the EOO for. Pixels with other
+                values are ignored.
+        geo: The geometry to use for the reduction. If not provided, the
+             geometry will be inferred from the class_img.
+        scale: The scale (in meters) for reducing the image pixels to polygons.
+               If not provided, the image's nominal scale will be used, with a
+               minimum of 50 meters per pixel.
+        max_pixels: The maximum number of pixels to process. Default is 1e12.
+        max_error: The maximum error in meters for the convex hull calculation.
+                   Default is 1.
+        best_effort: If True, uses best effort mode which may be less accurate
+                     but more likely to succeed for large areas. Default is False.
+        method: 'points' (default) hulls the westernmost and easternmost
+                presence pixel of each pixel row of each class, as in
+                make_eoo(). 'vectors' vectorizes the image once with
+                reduceToVectors, labelling each polygon with its class, and
+                hulls the polygons of each class.
+        tile_scale: Scaling factor used to split the reduction into smaller
+                    tiles. Default is 4.
+
+    Returns:
+        An ee.Dictionary mapping each label (as a string) to its EOO ee.Geometry.
+
+    Example:
+        >>> ecosystems = ee.Image('projects/goog-rle-assessments/assets/mm_ecosys_v7b')
+        >>> eoos = make_eoo_by_class(ecosystems, [37, 52])
+        >>> ee.Geometry(eoos.get('37')).area().getInfo()
+    """
+    if method not in ('points', 'vectors'):
+        raise ValueError(f"method must be 'points' or 'vectors', got {method!r}")
+
+    if geo is None:
+        geo = class_img.geometry()
+
     if scale is None:
         scale = max(class_img.projection().nominalScale().getInfo(), 50)
 
-    # Mask the image to only include presence pixels (value = 1)
-    # Then reduce to vectors to get all polygons
-    eoo_poly = (
-        class_img
-        .updateMask(1)
-        .reduceToVectors(
+    if method == 'points':
+        def class_hull(label):
+            points = _presence_row_extremes(
+                class_img.eq(ee.Number(label)), geo, scale,
+                max_pixels, best_effort, tile_scale,
+            )
+            return (
+                ee.Geometry.MultiPoint(points, proj='EPSG:4326')
+                .convexHull(maxError=max_error)
+            )
+    else:
+        # Only vectorize the requested classes
+        is_requested = class_img.remap(labels, [1] * len(labels), 0)
+        vectors = class_img.updateMask(is_requested).reduceToVectors(
             scale=scale,
+            crs='EPSG:4326',
             geometry=geo,
             geometryType='polygon',
+            labelProperty='label',
             maxPixels=max_pixels,
             bestEffort=best_effort,
+            tileScale=tile_scale,
         )
-        .geometry()
-        .convexHull(maxError=max_error)
-        # convexHull() is called twice as a workaround for a bug
-        # (https://issuetracker.google.com/issues/465490917)
-        .convexHull(maxError=max_error)
+
+        def class_hull(label):
+            return (
+                vectors
+                .filter(ee.Filter.eq('label', label))
+                .geometry()
+                .convexHull(maxError=max_error)
+                # convexHull() is called twice as a workaround for a bug
+                # (https://issuetracker.google.com/issues/465490917)
+                .convexHull(maxError=max_error)
+            )
+
+    hulls = ee.List(labels).map(class_hull)
+    return ee.Dictionary.fromLists([str(label) for label in labels], hulls)
+
+
+def _presence_row_extremes(
+    class_img: ee.Image,
+    geo: ee.Geometry,
+    scale: float,
+    max_pixels: int,
+    best_effort: bool,
+    tile_scale: int,
+) -> ee.List:
+    """
+    Return the [lon, lat] of the westernmost and easternmost presence pixel of
+    each pixel row of an EPSG:4326 grid at the given scale.
+
+    Only these pixels can lie on the convex hull of the presence pixels, so
+    they are all that is needed to compute the EOO.
+    """
+    # Bands: longitude (min/max per row), latitude (mean per row), row (group).
+    proj = ee.Projection('EPSG:4326').atScale(scale)
+    rows = ee.Image.pixelCoordinates(proj).select('y').floor().int().rename('row')
+    lonlat_rows = (
+        ee.Image.pixelLonLat()
+        .addBands(rows)
+        .updateMask(class_img)
+    )
+    row_extremes = lonlat_rows.reduceRegion(
+        reducer=(
+            ee.Reducer.minMax()
+            .combine(ee.Reducer.mean(), sharedInputs=False)
+            .group(groupField=2, groupName='row')
+        ),
+        geometry=geo,
+        crs=proj,
+        maxPixels=max_pixels,
+        bestEffort=best_effort,
+        tileScale=tile_scale,
     )
 
-    return eoo_poly
+    groups = ee.List(row_extremes.get('groups'))
+    lats = groups.map(lambda g: ee.Dictionary(g).get('mean'))
+    west = groups.map(lambda g: ee.Dictionary(g).get('min'))
+    east = groups.map(lambda g: ee.Dictionary(g).get('max'))
+    return west.zip(lats).cat(east.zip(lats))
+
+
+def _convex_hull_client_side(coords: list, max_error: float) -> ee.Geometry:
+    """
+    Compute the convex hull of [lon, lat] points locally with Qhull.
+
+    Returns the hull as a planar EPSG:4326 ee.Geometry.Polygon. Degenerate
+    inputs (fewer than three non-collinear points) are passed to EE, which
+    returns a point, line or empty geometry as appropriate.
+    """
+    # scipy is only needed for this method, so import it here
+    import numpy as np
+    from scipy.spatial import ConvexHull, QhullError
+
+    points = np.asarray(coords, dtype=float).reshape(-1, 2)
+    try:
+        hull = ConvexHull(points)
+    except (QhullError, ValueError):
+        return (
+            ee.Geometry.MultiPoint(points.tolist(), proj='EPSG:4326')
+            .convexHull(maxError=max_error)
+        )
+
+    # Qhull returns 2-D hull vertices in counter-clockwise order
+    return ee.Geometry.Polygon(
+        [points[hull.vertices].tolist()],
+        proj='EPSG:4326',
+        geodesic=False,
+    )
 
 
 def area_km2(
@@ -164,36 +513,142 @@ def area_km2(
     return eoo_poly.area().divide(1e6)
 
 
-def ensure_asset_folder_exists(folder_path: str) -> bool:
+def area_km2_many(
+    eoo_polys: list[ee.Geometry],
+) -> list[float]:
     """
-    Check if an Earth Engine asset folder exists, create it if it doesn't.
+    Calculate the areas of several EOO polygons in square kilometers.
+
+    All areas are evaluated server-side in a single request, instead of one
+    getInfo() round trip per polygon.
 
     Args:
-        folder_path: Full path to the asset folder
-                     (e.g., 'projects/goog-rle-assessments/assets/MMR-T1_1_1')
+        eoo_polys: A list of ee.Geometry objects representing EOO polygons.
 
     Returns:
-        True if the folder was created, False if it already existed.
+        A list of the EOO areas in square kilometers, in the same order as
+        eoo_polys.
 
     Example:
-        >>> import ee
-        >>> ee.Initialize()
-        >>> ensure_asset_folder_exists('projects/my-project/assets/my-folder')
-        True  # Folder was created
-        >>> ensure_asset_folder_exists('projects/my-project/assets/my-folder')
-        False  # Folder already exists
+        >>> eoo_polys = [make_eoo(img) for img in habitat_maps]
+        >>> area_km2_many(eoo_polys)
+        [12634.46, 8410.12]
     """
+    return ee.List([area_km2(poly) for poly in eoo_polys]).getInfo()
+
+
+def eoo_areas_km2(
+    class_img: ee.Image,
+    labels: list[int],
+    **kwargs,
+) -> dict[int, float]:
+    """
+    Calculate the EOO areas of several classes of a multi-class image.
+
+    The hulls are built with make_eoo_by_class() and their areas are computed
+    server-side, so all classes are evaluated with a single getInfo() instead
+    of one round trip per class.
+
+    Args:
+        class_img: A single-band ee.Image of integer class labels.
+        labels: The class labels to compute the EOO area for.
+        **kwargs: Additional keyword arguments passed to make_eoo_by_class().
+
+    Returns:
+        A dict mapping each label to its EOO area in square kilometers.
+
+    Example:
+        >>> ecosystems = ee.Image('projects/goog-rle-assessments/assets/mm_ecosys_v7b')
+        >>> eoo_areas_km2(ecosystems, [37, 52])
+        {37: 12634.46, 52: 8410.12}
+    """
+    eoos = make_eoo_by_class(class_img, labels, **kwargs)
+    areas = eoos.map(lambda label, eoo: area_km2(ee.Geometry(eoo))).getInfo()
+    return {label: areas[str(label)] for label in labels}
+
+
+def make_eoo_many(
+    class_imgs: list[ee.Image],
+    geos: list[ee.Geometry] = None,
+    scale: int = None,
+    **kwargs,
+) -> ee.List:
+    """
+    Calculate the Extent of Occurrence (EOO) polygons of several binary images.
+
+    The hulls are built into a single ee.List, so one getInfo() on a value
+    derived from it (e.g. the areas) evaluates all of them in one request.
+    When scale is not given, the nominal scales of all images are also
+    fetched in a single request rather than one per image.
+
+    Args:
+        class_imgs: A list of binary ee.Image objects (see make_eoo).
+        geos: An optional list of geometries, one per image. If not provided,
+              each geometry is inferred from its image.
+        scale: The scale (in meters) for all reductions. If not provided, each
+               image's nominal scale is used, with a minimum of 50 meters.
+        **kwargs: Additional keyword arguments passed to make_eoo.
+
+    Returns:
+        An ee.List of ee.Geometry EOO polygons, in the same order as class_imgs.
+    """
+    if geos is None:
+        geos = [None] * len(class_imgs)
+    if len(geos) != len(class_imgs):
+        raise ValueError(
+            f"geos must have one geometry per image, got {len(geos)} "
+            f"geometries for {len(class_imgs)} images"
+        )
+
+    if scale is None:
+        nominal_scales = ee.List(
+            [img.projection().nominalScale() for img in class_imgs]
+        ).getInfo()
+        scales = [max(s, 50) for s in nominal_scales]
+    else:
+        scales = [scale] * len(class_imgs)
+
+    return ee.List([
+        make_eoo(img, geo, scale=img_scale, **kwargs)
+        for img, geo, img_scale in zip(class_imgs, geos, scales)
+    ])
+
+
+@functools.lru_cache(maxsize=128)
+def _list_child_assets(parent: str) -> frozenset[str]:
+    """
+    Return the names and IDs of the assets directly inside an asset folder.
+
+    The listing is cached per parent, so checking many folders under the same
+    parent takes a single request. Failed listings raise ee.EEException and
+    are not cached.
+    """
+    assets = ee.data.listAssets({'parent': parent}).get('assets', [])
+
+    # 'name' is the full resource name, 'id' the legacy-style path
+    return frozenset(
+        asset[key] for asset in assets for key in ('name', 'id') if key in asset
+    )
+
+
+def _asset_exists(asset_path: str) -> bool:
+    """Return whether an asset exists, using the cached listing of its parent."""
+    parent = asset_path.rsplit('/', 1)[0]
     try:
-        ee.data.getAsset(folder_path)
-        return False  # Folder already exists
+        return asset_path in _list_child_assets(parent)
     except ee.EEException:
-        # Folder doesn't exist, create it
-        ee.data.createFolder(folder_path)
-        return True  # Folder was created
+        # The parent cannot be listed (e.g. it does not exist yet), so ask
+        # for the asset itself
+        try:
+            ee.data.getAsset(asset_path)
+            return True
+        except ee.EEException:
+            return False
 
-def create_asset_folder(folder_path: str) -> bool:
+
+def ensure_asset_folder_exists(folder_path: str) -> bool:
     """
-    Create an Earth Engine asset folder if it doesn't already exist.
+    Check if an Earth Engine asset folder exists, create it if it doesn't.
 
     Args:
         folder_path: Full path to the asset folder
@@ -205,28 +660,75 @@ def create_asset_folder(folder_path: str) -> bool:
     Example:
         >>> import ee
         >>> ee.Initialize()
-        >>> create_asset_folder('projects/my-project/assets/my-folder')
+        >>> ensure_asset_folder_exists('projects/my-project/assets/my-folder')
         True  # Folder was created
-        >>> create_asset_folder('projects/my-project/assets/my-folder')
+        >>> ensure_asset_folder_exists('projects/my-project/assets/my-folder')
         False  # Folder already exists
+
+    Note:
+        Existing folders are looked up with one cached listing of the parent
+        folder, so folders created outside this process after the first
+        check are not seen until _list_child_assets.cache_clear() is called.
     """
-    try:
-        ee.data.getAsset(folder_path)
+    if _asset_exists(folder_path):
         return False  # Folder already exists
-    except ee.EEException:
-        # Folder doesn't exist, create it
-        ee.data.createFolder(folder_path)
-        return True  # Folder was created
 
+    # Folder doesn't exist, create it and drop the now stale listings
+    ee.data.createFolder(folder_path)
+    _list_child_assets.cache_clear()
+    return True  # Folder was created
 
-def export_fractional_coverage_on_aoo_grid(
+
+# create_asset_folder() was an identical copy of ensure_asset_folder_exists()
+# and is kept as an alias for existing callers.
+create_asset_folder = ensure_asset_folder_exists
+
+
+def _fractional_coverage_image(
+    class_img: ee.Image,
+    max_pixels: int,
+    intermediate_scale: float = 100,
+) -> ee.Image:
+    """
+    Return the fractional coverage of a binary image on the AOO grid.
+
+    The coverage is aggregated in two stages: native pixels are first averaged
+    onto an intermediate grid (100 m by default), which is then averaged onto
+    the 10 km AOO grid. Each stage reads far fewer input pixels per output
+    pixel than a single native-to-10 km reduction.
+
+    max_pixels limits the input pixels per output pixel in both stages. Stage 1
+    reads (intermediate_scale / native scale)^2 pixels per cell, so the default
+    of 65536 covers inputs down to about 0.4 m resolution.
+    """
+    # Stage 1: native resolution -> intermediate grid ((100 m / 1 m)^2 = 10^4
+    # pixels per cell for 1 m masks)
+    coarse = class_img.unmask().reduceResolution(
+        reducer=ee.Reducer.mean(),
+        maxPixels=max_pixels
+    ).reproject(class_img.projection().atScale(intermediate_scale))
+
+    # Stage 2: intermediate grid -> AOO grid ((10 km / 100 m)^2 = 10^4 pixels per cell)
+    fcov_unmasked = coarse.reduceResolution(
+        reducer=ee.Reducer.mean(),
+        maxPixels=max_pixels
+    ).reproject(get_aoo_grid_projection())
+
+    # Mask out zero values.
+    return fcov_unmasked.mask(fcov_unmasked.gt(0))
+
+
+def build_fractional_coverage_export_task(
     class_img: ee.Image,
     asset_id: str,
     export_description: str,
     max_pixels: int = 65536,
-) -> str:
+) -> ee.batch.Task:
     """
-    Export the fractional coverage of a binary image on the AOO grid.
+    Build (but do not start) a task exporting the fractional coverage of a
+    binary image on the AOO grid.
+
+    Use this with start_tasks() to start many exports concurrently.
 
     Args:
         class_img: A binary ee.Image where pixels with value 1 represent presence
@@ -236,22 +738,15 @@ def export_fractional_coverage_on_aoo_grid(
         max_pixels: The maximum number of pixels to process. Default is 65536.
 
     Returns:
-        A ee.batch.Task object.
+        An unstarted ee.batch.Task object.
     """
 
-    fcov_unmasked = class_img.unmask().reduceResolution(
-        reducer=ee.Reducer.mean(),
-        maxPixels=max_pixels
-    ).reproject(get_aoo_grid_projection())
-
-    # Mask out zero values.
-    fractionalCoverage = fcov_unmasked.mask(fcov_unmasked.gt(0))
-
-    task = ee.batch.Export.image.toAsset(
-        image=fractionalCoverage,
+    return ee.batch.Export.image.toAsset(
+        image=_fractional_coverage_image(class_img, max_pixels),
         description=export_description,
         assetId=asset_id,
-        crs=get_aoo_grid_projection().getInfo()['wkt'],
+        # The WKT is known locally, so no getInfo() is needed to pass the CRS
+        crs=_WKT_54034,
         # Set scale to avoid errors:
         #    with no scale specified, the task fails with:
         #      "Export too large: specified 2557382439248 pixels (max: 100000000)"
@@ -267,5 +762,137 @@ def export_fractional_coverage_on_aoo_grid(
         #       the task succeeds (522 EECU-seconds)
         scale=1000,
     )
+
+
+def start_tasks(
+    tasks: list[ee.batch.Task],
+    max_workers: int = 16,
+) -> list[ee.batch.Task]:
+    """
+    Start several Earth Engine tasks concurrently.
+
+    Each task.start() is a separate request, so the requests are issued from
+    a thread pool instead of one after another.
+
+    Args:
+        tasks: The unstarted ee.batch.Task objects to start.
+        max_workers: The maximum number of concurrent start requests.
+                     Default is 16.
+
+    Returns:
+        The started tasks, in the same order as tasks.
+
+    Example:
+        >>> tasks = [
+        ...     build_fractional_coverage_export_task(img, asset_id, desc)
+        ...     for img, asset_id, desc in exports
+        ... ]
+        >>> start_tasks(tasks)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() waits for every start and re-raises the first error
+        list(executor.map(lambda task: task.start(), tasks))
+    return list(tasks)
+
+
+def export_fractional_coverage_on_aoo_grid(
+    class_img: ee.Image,
+    asset_id: str,
+    export_description: str,
+    max_pixels: int = 65536,
+) -> ee.batch.Task:
+    """
+    Export the fractional coverage of a binary image on the AOO grid.
+
+    Args:
+        class_img: A binary ee.Image where pixels with value 1 represent presence
+                   and 0/masked pixels represent absence.
+        asset_id: The Earth Engine asset ID to export the fractional coverage to.
+        export_description: The description to use for the export task.
+        max_pixels: The maximum number of pixels to process. Default is 65536.
+
+    Returns:
+        A ee.batch.Task object.
+    """
+    task = build_fractional_coverage_export_task(
+        class_img, asset_id, export_description, max_pixels=max_pixels
+    )
     task.start()
-    return task
\ No newline at end of file
+    return task
+
+
+def download_fractional_coverage_on_aoo_grid(
+    class_img: ee.Image,
+    out_path: str,
+    region: ee.Geometry = None,
+    max_pixels: int = 65536,
+    timeout: int = 300,
+) -> str:
+    """
+    Download the fractional coverage of a binary image on the AOO grid as a GeoTIFF.
+
+    For grids small enough for a single getDownloadURL request, this returns
+    in seconds rather than waiting for an export task to be scheduled, and it
+    does not count towards the task quota.
+
+    Args:
+        class_img: A binary ee.Image where pixels with value 1 represent presence
+                   and 0/masked pixels represent absence.
+        out_path: Local path to write the GeoTIFF to.
+        region: The region to download. If not provided, the geometry of
+                class_img is used.
+        max_pixels: The maximum number of pixels to process. Default is 65536.
+        timeout: Timeout in seconds for the download request. Default is 300.
+
+    Returns:
+        The path of the written GeoTIFF.
+    """
+    if region is None:
+        region = class_img.geometry()
+
+    url = _fractional_coverage_image(class_img, max_pixels).getDownloadURL({
+        'region': region,
+        'format': 'GEO_TIFF',
+        'crs': _WKT_54034,
+        'scale': 10000,  # The AOO grid cell size
+    })
+
+    # Stream to disk rather than holding the whole response in memory
+    with requests.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        with open(out_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+    return out_path
+
+
+def download_fractional_coverage_many(
+    class_imgs: list[ee.Image],
+    out_paths: list[str],
+    max_workers: int = 8,
+    **kwargs,
+) -> list[str]:
+    """
+    Download the fractional coverage of several binary images concurrently.
+
+    Args:
+        class_imgs: A list of binary ee.Image objects.
+        out_paths: Local GeoTIFF paths, one per image.
+        max_workers: The maximum number of concurrent downloads. Default is 8.
+        **kwargs: Additional keyword arguments passed to
+                  download_fractional_coverage_on_aoo_grid.
+
+    Returns:
+        The paths of the written GeoTIFFs, in the same order as class_imgs.
+    """
+    if len(out_paths) != len(class_imgs):
+        raise ValueError(
+            f"out_paths must have one path per image, got {len(out_paths)} "
+            f"paths for {len(class_imgs)} images"
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda args: download_fractional_coverage_on_aoo_grid(*args, **kwargs),
+            zip(class_imgs, out_paths),
+        ))
@@ -1,39 +1,86 @@
-import typer
-from typing_extensions import Annotated
-from gee_redlist.ee_auth import print_authentication_status
+import sys
+
 from gee_redlist import __version__
 
-app = typer.Typer(
-    name="gee-redlist-python",
-    help="Google Earth Engine tools for IUCN Red List analysis",
-    add_completion=False,
-)
+
+def _print_version():
+    print(f"gee-redlist-python version {__version__}")
+
+
+def _print_welcome():
+    print("Hello from gee-redlist-python!")
+    print("\nUse --help to see available commands")
+
+
+def _build_app():
+    """Build the Typer application (typer is only imported when needed)."""
+    import typer
+    from typing_extensions import Annotated
+
+    app = typer.Typer(
+        name="gee-redlist-python",
+        help="Google Earth Engine tools for IUCN Red List analysis",
+        add_completion=False,
+    )
+
+    @app.command()
+    def test_auth():
+        """Test Earth Engine authentication status."""
+        from gee_redlist.ee_auth import print_authentication_status
+
+        print("Testing Earth Engine authentication...")
+        print_authentication_status()
+
+    @app.callback(invoke_without_command=True)
+    def main(
+        ctx: typer.Context,
+        version: Annotated[
+            bool,
+            typer.Option("--version", "-v", help="Show version and exit"),
+        ] = False,
+    ):
+        """Main entry point for gee-redlist-python CLI."""
+        if version:
+            _print_version()
+            raise typer.Exit()
+
+        if ctx.invoked_subcommand is None:
+            _print_welcome()
+
+    return app
+
+
+def __getattr__(name):
+    # The Typer app is created on first access so that importing this module
+    # does not import typer, click and rich.
+    if name == "app":
+        app = _build_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@app.command()
-def test_auth():
-    """Test Earth Engine authentication status."""
-    print("Testing Earth Engine authentication...")
-    print_authentication_status()
+def run(argv: list[str] | None = None):
+    """
+    Run the CLI.
 
+    Invocations without a subcommand and --version/-v are handled directly,
+    without importing typer. Everything else is dispatched to the Typer app.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
 
-@app.callback(invoke_without_command=True)
-def main(
-    ctx: typer.Context,
-    version: Annotated[
-        bool,
-        typer.Option("--version", "-v", help="Show version and exit"),
-    ] = False,
-):
-    """Main entry point for gee-redlist-python CLI."""
-    if version:
-        print(f"gee-redlist-python version {__version__}")
-        raise typer.Exit()
+    if not argv:
+        _print_welcome()
+        return
+    if argv[0] in ("--version", "-v"):
+        _print_version()
+        return
 
-    if ctx.invoked_subcommand is None:
-        print("Hello from gee-redlist-python!")
-        print("\nUse --help to see available commands")
+    # Use the app cached by __getattr__ if it was already built
+    app = globals().get("app") or __getattr__("app")
+    app(args=argv)
 
 
 if __name__ == "__main__":
-    app()
+    run()
@@ -3,18 +3,32 @@
 import matplotlib
 matplotlib.use('Agg') 
 
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import logging
+import math
+import os
+import threading
+
 import ee
-import matplotlib.pyplot as plt
+import matplotlib.colors
+import matplotlib.image
+from matplotlib.figure import Figure
+import cartopy
 import cartopy.crs as ccrs
-import cartopy.feature as cfeature
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 import pyproj
-import requests
-from rasterio.io import MemoryFile
 import shapely
-from shapely.ops import transform as shapely_transform
 import wkls
 
+logger = logging.getLogger(__name__)
+
+# Value of masked pixels in Earth Engine basemap downloads. It is an integer, so
+# unmasking integer images keeps them integer (widened to fit it, if needed),
+# and it is exactly representable as a float for float images.
+_MASKED_VALUE = -2**31
+
 
 def get_utm_epsg(lon: float, lat: float) -> int:
     """
@@ -71,8 +85,44 @@ def get_utm_epsg(lon: float, lat: float) -> int:
     return epsg_code
 
 
+def get_utm_epsg_many(lons, lats) -> np.ndarray:
+    """
+    Determine the UTM EPSG codes for many points at once.
+
+    Vectorized equivalent of get_utm_epsg(), computing all zones in NumPy
+    rather than with one Python call per point.
+
+    Parameters
+    ----------
+    lons : array_like
+        Longitudes in decimal degrees (-180 to 180)
+    lats : array_like
+        Latitudes in decimal degrees (-90 to 90), broadcastable with lons
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of EPSG codes (326xx north, 327xx south)
+
+    Examples
+    --------
+    >>> get_utm_epsg_many([-122.4, 103.8, -43.2], [37.8, 1.3, -22.9])
+    array([32610, 32648, 32723])
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    utm_zones = np.clip(np.floor((lons + 180) / 6).astype(np.int64) + 1, 1, 60)
+    return np.where(lats >= 0, 32600, 32700) + utm_zones
+
+
+@functools.lru_cache(maxsize=120)
 def get_utm_proj_without_limits(utm_zone: int, is_south: bool) -> ccrs.TransverseMercator:
-    """Get a UTM projection without the hard-coded x_limits."""
+    """
+    Get a UTM projection without the hard-coded x_limits.
+
+    Projections are cached, so each of the 60 zones x 2 hemispheres is only
+    built once per process.
+    """
 
     # Zone N covers longitudes from (N-1)*6° - 180° to N*6° - 180°
     # Central meridian is at the middle: (N-1)*6° - 180° + 3°
@@ -89,6 +139,158 @@ def get_utm_proj_without_limits(utm_zone: int, is_south: bool) -> ccrs.Transvers
     return proj
 
 
+@functools.lru_cache(maxsize=128)
+def _get_transformer(epsg: int) -> pyproj.Transformer:
+    """Return a cached WGS84 to EPSG:{epsg} transformer (lon/lat axis order)."""
+    return pyproj.Transformer.from_crs("EPSG:4326", f"EPSG:{epsg}", always_xy=True)
+
+
+def _transform_geometry(geometry: shapely.Geometry, epsg: int) -> shapely.Geometry:
+    """
+    Transform a WGS84 geometry to EPSG:{epsg}.
+
+    All vertices are transformed in a single vectorized call, instead of one
+    Python callback per vertex as with shapely.ops.transform.
+    """
+    transformer = _get_transformer(epsg)
+
+    def transform_coords(coords):
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([xs, ys])
+
+    return shapely.transform(geometry, transform_coords)
+
+
+# Default size (in inches) of the figures used by create_country_map()
+_FIGSIZE = (12, 8)
+
+# Figures reused by create_country_map(), one per thread (see _get_figure())
+_FIGURES = threading.local()
+
+
+def _get_figure() -> Figure:
+    """
+    Return the calling thread's figure, cleared and ready for a new map.
+
+    An off-screen Figure is created on first use in each thread and cleared
+    between maps, instead of creating (and closing) a pyplot figure for every
+    map. Keeping one figure per thread lets maps be created from several
+    threads at once.
+    """
+    fig = getattr(_FIGURES, 'figure', None)
+    if fig is None:
+        fig = _FIGURES.figure = Figure(figsize=_FIGSIZE)
+    else:
+        fig.clear()
+    return fig
+
+
+@functools.lru_cache(maxsize=1)
+def _stock_image() -> np.ndarray:
+    """
+    Return the Natural Earth shaded relief image used by GeoAxes.stock_img().
+
+    The PNG is decoded once per process instead of on every map.
+    """
+    fname = (cartopy.config["repo_data_dir"] / 'raster' / 'natural_earth'
+             / '50-natural-earth-1-downsampled.png')
+    return matplotlib.image.imread(fname)
+
+
+@functools.lru_cache(maxsize=16)
+def _warped_stock_image(utm_zone: int, is_south: bool) -> tuple[np.ndarray, tuple]:
+    """
+    Return the stock relief image warped to a UTM projection, and its extent.
+
+    This is the regridding GeoAxes.stock_img() performs on a new map (over
+    the projection's full domain at cartopy's default 750 pixel resolution),
+    cached per zone and hemisphere. The result can be drawn with imshow in
+    the map's projection without further warping.
+    """
+    from cartopy.img_transform import warp_array
+
+    proj = get_utm_proj_without_limits(utm_zone, is_south)
+    target_extent = proj.x_limits + proj.y_limits
+    x_range = target_extent[1] - target_extent[0]
+    y_range = target_extent[3] - target_extent[2]
+    if x_range >= y_range:
+        target_res = (int(750 * x_range / y_range), 750)
+    else:
+        target_res = (750, int(750 * y_range / x_range))
+
+    # warp_array expects the image with its origin at the bottom
+    img, extent = warp_array(
+        _stock_image()[::-1],
+        source_proj=ccrs.PlateCarree(),
+        source_extent=[-180, 180, -90, 90],
+        target_proj=proj,
+        target_res=target_res,
+        target_extent=target_extent,
+        mask_extrapolated=True,
+    )
+
+    # Pixels outside the globe are masked; make them transparent
+    rgba = np.ones(img.shape[:2] + (4,), dtype=img.dtype)
+    rgba[..., :3] = img[..., :3]
+    rgba[np.any(np.ma.getmaskarray(img)[..., :3], axis=2), 3] = 0
+    return rgba, extent
+
+
+def _to_rgba(
+    img_array: np.ndarray,
+    valid: np.ndarray,
+    cmap: str | matplotlib.colors.Colormap,
+    vmin: float,
+    vmax: float,
+) -> np.ndarray:
+    """
+    Colour an image as a uint8 RGBA array for imshow.
+
+    Single-band images are coloured with cmap between vmin and vmax; images
+    with several bands are treated as RGB, as imshow does: in the 0-1 range
+    for float data and the 0-255 range for integer data.
+    Pixels where valid is False are fully transparent.
+
+    Parameters
+    ----------
+    img_array : np.ndarray
+        Image of shape (height, width, bands)
+    valid : np.ndarray
+        Boolean array of shape (height, width)
+    cmap : str or matplotlib.colors.Colormap
+        Matplotlib colormap (or its name) for single-band images
+    vmin, vmax : float
+        Data range covered by the colormap
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (height, width, 4) and dtype uint8
+    """
+    if img_array.shape[-1] == 1:
+        norm = matplotlib.colors.Normalize(vmin=vmin, vmax=vmax)
+        rgba = matplotlib.colormaps.get_cmap(cmap)(norm(img_array[..., 0]), bytes=True)
+    else:
+        rgba = np.empty(img_array.shape[:2] + (4,), dtype=np.uint8)
+        if np.issubdtype(img_array.dtype, np.integer):
+            rgba[..., :3] = np.clip(img_array[..., :3], 0, 255)
+        else:
+            rgba[..., :3] = np.clip(img_array[..., :3], 0, 1) * 255
+    rgba[..., 3] = np.where(valid, 255, 0)
+    return rgba
+
+
+@functools.lru_cache(maxsize=512)
+def _load_country_geometry(country_code: str) -> shapely.Geometry:
+    """
+    Return the WGS84 boundary of a country from wkls.
+
+    Geometries are cached by lowercase country code, so repeated maps of the
+    same country do not look up and parse its WKB again.
+    """
+    return shapely.from_wkb(bytes(wkls[country_code].wkb()))
+
+
 def _validate_country_code(country_code: str) -> None:
     """
     Validate that the country code is a valid ISO 3166-1 alpha-2 code.
@@ -113,9 +315,8 @@ def _validate_country_code(country_code: str) -> None:
     if not country_code or country_code.isspace():
         raise ValueError("country_code cannot be empty or whitespace")
 
-    # Strict validation: must be exactly 2 letters (ISO 3166-1 alpha-2)
-    import re
-    if not re.match(r'^[A-Za-z]{2}$', country_code):
+    # Strict validation: must be exactly 2 ASCII letters (ISO 3166-1 alpha-2)
+    if not (len(country_code) == 2 and country_code.isascii() and country_code.isalpha()):
         raise ValueError(
             f"country_code must be a 2-letter ISO 3166-1 alpha-2 code (e.g., 'US', 'FR', 'JP'). "
             f"Got: '{country_code}'"
@@ -135,6 +336,7 @@ def create_country_map(
     image_cmap: str = None,
     image_vmin: float = 0,
     image_vmax: float = 1,
+    image_quantize: bool = False,
 ) -> str:
     """
     Create a PNG map of a specified country.
@@ -163,6 +365,12 @@ def create_country_map(
         Whether to clip the Earth Engine image to the country geometry.
         If True, only the portion of the image within the country borders is shown.
         If False (default), the image covers the full map extent.
+    image_quantize : bool, optional
+        Whether to download the Earth Engine image as 8-bit values. If True,
+        values between image_vmin and image_vmax are scaled to 0-254 by Earth
+        Engine (values outside the range are clamped), which makes the download
+        4 times smaller than float values without a visible difference, since
+        colormaps have 256 levels. Default is False.
 
     Returns
     -------
@@ -175,7 +383,7 @@ def create_country_map(
     'sg.png'
     >>> create_country_map('FR', 'maps/france_map.png')
     'maps/france_map.png'
-    >>> create_country_map('BR', show_surrounding_countries=False)
+    >>> create_country_map('BR', show_border=False)
     'br.png'
     """
     # Validate country code format
@@ -186,7 +394,7 @@ def create_country_map(
 
     # Use wkls to obtain the country boundary information by ISO 3166-1 alpha-2 code
     try:
-        country_wkb = wkls[country_code.lower()].wkb()
+        country_geometry = _load_country_geometry(country_code.lower())
     except ValueError as e:
         # Provide a more helpful error message
         raise ValueError(
@@ -194,8 +402,6 @@ def create_country_map(
             f"Please use a valid ISO 3166-1 alpha-2 code (e.g., 'US', 'FR', 'JP')."
         ) from e
 
-    country_geometry = shapely.from_wkb(bytes(country_wkb))
-
     # Calculate the most appropriate UTM projection for this country
     # Use the centroid of the country to determine the UTM zone
     centroid = country_geometry.centroid
@@ -209,23 +415,26 @@ def create_country_map(
     proj = get_utm_proj_without_limits(utm_zone, is_south)
 
     # Create a figure and axis with UTM projection
-    fig = plt.figure(figsize=(12, 8))
+    fig = _get_figure()
     ax = fig.add_subplot(1, 1, 1, projection=proj)
 
     if show_stock_img:
-        # Show the world stock image for reference
-        ax.stock_img(alpha=1.0)
-
-    # Transform the countrygeometry to UTM
-    wgs84_to_utm = pyproj.Transformer.from_crs(
-        "EPSG:4326",  # WGS84
-        f"EPSG:{utm_epsg}",  # UTM
-        always_xy=True
-    )
-    country_geometry_utm = shapely_transform(wgs84_to_utm.transform, country_geometry)
+        # Show the world stock image for reference (equivalent to ax.stock_img(),
+        # but with the image warped to this UTM projection only once)
+        stock_img, stock_extent = _warped_stock_image(utm_zone, is_south)
+        ax.imshow(
+            stock_img,
+            origin='lower',
+            transform=proj,
+            extent=stock_extent,
+            alpha=1.0,
+        )
 
-    # Get bounds in UTM coordinates (meters)
-    bounds = country_geometry_utm.bounds
+    # Get bounds in UTM coordinates (meters). Only the convex hull is reprojected
+    # for this, densified so that its edges follow the curvature of the projection,
+    # rather than every vertex of the country boundary.
+    country_hull = shapely.segmentize(country_geometry.convex_hull, 0.1)
+    bounds = _transform_geometry(country_hull, utm_epsg).bounds
 
     # Calculate padding as a percentage of the extent (5% on each side)
     x_range = bounds[2] - bounds[0]
@@ -239,101 +448,167 @@ def create_country_map(
         bounds[1] - padding_y, # miny
         bounds[3] + padding_y # maxy
     ]
-    ax.set_extent(extent, crs=proj)
+    # The extent is already in the axes projection, so set the limits directly
+    # rather than through set_extent(), which reprojects and clips the extent
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
+
+    # Size the figure to the map's aspect ratio (within the default 12 x 8
+    # inches) and let the axes fill it, leaving room for the title. This gives
+    # the framing bbox_inches='tight' produced without its extra draw pass.
+    map_aspect = (extent[1] - extent[0]) / (extent[3] - extent[2])
+    map_width = min(_FIGSIZE[0], _FIGSIZE[1] * map_aspect)
+    map_height = map_width / map_aspect
+    title_height = 0.5 if title else 0  # inches
+    fig.set_size_inches(map_width, map_height + title_height)
+    fig.subplots_adjust(
+        left=0, right=1, bottom=0, top=map_height / (map_height + title_height)
+    )
+
+    # Size of an output pixel in map units (meters)
+    pixel_size = (extent[1] - extent[0]) / (map_width * dpi)
 
     # Add Earth Engine image as basemap if provided
     if ee_image is not None:
 
-        # Create a bounding box for the EE image request [xMin, yMin, xMax, yMax]
-        ee_region = ee.Geometry.Rectangle(
-            [extent[0], extent[2], extent[1], extent[3]],
-            proj=ee.Projection(f'EPSG:{utm_epsg}'),
-            evenOdd=False
-        )
+        # Create a bounding box for the EE image request [xMin, yMin, xMax, yMax].
+        # A clipped image is empty outside the country, so only the country's
+        # bounds are requested rather than the padded map extent.
+        if clip_ee_image:
+            region_coords = list(bounds)
+        else:
+            region_coords = [extent[0], extent[2], extent[1], extent[3]]
 
         def add_ee_image(
             ee_image: ee.Image,
-            ee_region: ee.Geometry,
+            region_coords: list[float],
             scale: float = 10000,
             clip_ee_image: bool = False,
             image_cmap: str = None,
-            ) -> np.ma.MaskedArray:
-            """Download an Earth Engine image and return a numpy masked array."""
+            ) -> None:
+            """Compute the pixels of an Earth Engine image and draw them on the map."""
         
             # Clip the image to country geometry if requested
             if clip_ee_image:
                 # Convert shapely geometry to GeoJSON
                 # Note: Use WGS84 geometry for EE - it doesn't support MultiPolygon in projected CRS
+                # Detail finer than half a pixel does not change which pixels are
+                # clipped, so simplify first (degrees, using ~111 km per degree)
                 from shapely.geometry import mapping
-                geojson = mapping(country_geometry)
-                ee_geometry = ee.Geometry(geojson)
+                clip_geometry = shapely.simplify(country_geometry, scale / 2 / 111_320)
+                geojson = mapping(clip_geometry)
+                # The boundary's edges are straight lines in lon/lat, so declare them
+                # planar; EE would otherwise treat them as geodesics
+                ee_geometry = ee.Geometry(geojson, 'EPSG:4326', geodesic=False)
                 ee_image_clipped = ee_image.clip(ee_geometry)
             else:
                 ee_image_clipped = ee_image
 
-            # Get the image URL from Earth Engine as GeoTIFF
-            # Use getDownloadURL with the appropriate UTM projection for this country
-            # NOTE that getDownloadURL does not return a GeoTIFF with noData, so the mask needs to be
-            # requested separately
-            crs = f'EPSG:{utm_epsg}'
-            crs_transform = [scale, 0, extent[0], 0, scale, extent[2]]
-            url = ee_image_clipped.getDownloadURL({
-                'region': ee_region,
-                'format': 'GEO_TIFF',
-                'crs': crs,
-                'crs_transform': crs_transform,
-            })
-            print(f"Downloading Earth Engine image...")
-            response = requests.get(url, timeout=300)  # 5 minute timeout
-            print(f"Downloaded image {len(response.content) / 1024 / 1024:.2f} MB")
-
-            url_mask = ee_image_clipped.mask().getDownloadURL({
-                'region': ee_region,
-                'format': 'GEO_TIFF',
-                'crs': crs,
-                'crs_transform': crs_transform,
+            # Only the first band (colormapped) or the first three (RGB) are
+            # displayed, so only those are computed and transferred
+            ee_image_displayed = ee_image_clipped.select(
+                ee_image_clipped.bandNames().slice(0, 3)
+            )
+
+            # NOTE that computePixels does not return the image mask, so masked
+            # pixels are filled with a sentinel value and detected after the download,
+            # instead of downloading the mask as well.
+            if image_quantize:
+                # Values 0-254 span image_vmin to image_vmax; 255 marks masked pixels
+                masked_value = 255
+                ee_image_filled = (
+                    ee_image_displayed
+                    .unitScale(image_vmin, image_vmax)
+                    .clamp(0, 1)
+                    .multiply(254)
+                    .round()
+                    .toUint8()
+                    .unmask(masked_value, sameFootprint=False)
+                )
+            else:
+                # The bands keep their native type (integer or float), so that
+                # 0-255 RGB images can be told apart from 0-1 RGB images
+                masked_value = _MASKED_VALUE
+                ee_image_filled = ee_image_displayed.unmask(
+                    masked_value, sameFootprint=False
+                )
+
+            # Pixel grid in the map's UTM projection covering the region, anchored
+            # at the map's lower left corner so image pixels line up with the
+            # output pixels
+            col_min = math.floor((region_coords[0] - extent[0]) / scale)
+            col_max = math.ceil((region_coords[2] - extent[0]) / scale)
+            row_min = math.floor((region_coords[1] - extent[2]) / scale)
+            row_max = math.ceil((region_coords[3] - extent[2]) / scale)
+            left = extent[0] + col_min * scale
+            right = extent[0] + col_max * scale
+            bottom = extent[2] + row_min * scale
+            top = extent[2] + row_max * scale
+            grid = {
+                'dimensions': {'width': col_max - col_min, 'height': row_max - row_min},
+                'affineTransform': {
+                    'scaleX': scale,
+                    'shearX': 0,
+                    'translateX': left,
+                    'shearY': 0,
+                    'scaleY': -scale,
+                    'translateY': top,
+                },
+                'crsCode': f'EPSG:{utm_epsg}',
+            }
+
+            # Get the pixels directly as a NumPy array in one request, rather than
+            # requesting a download URL, then downloading and decoding a GeoTIFF
+            logger.debug(
+                "Computing Earth Engine image pixels (%d x %d)",
+                grid['dimensions']['width'], grid['dimensions']['height'],
+            )
+            pixels = ee.data.computePixels({
+                'expression': ee_image_filled,
+                'fileFormat': 'NUMPY_NDARRAY',
+                'grid': grid,
             })
-            response_mask = requests.get(url_mask, timeout=300)  # 5 minute timeout
-            print(f"Downloaded mask {len(response_mask.content) / 1024 / 1024:.2f} MB")
-
-            # Open with rasterio from memory
-            with MemoryFile(response.content) as memfile:
-                with memfile.open() as dataset:
-                    img_array = dataset.read()  # Shape: (1, height, width)
-                    # reorder bands to be in the correct order for matplotlib
-                    img_array = np.moveaxis(img_array, 0, -1)  # Shape: (height, width, bands)
-                    # Get georeferencing from the raster
-                    bounds = dataset.bounds
-
-            with MemoryFile(response_mask.content) as memfile_mask:
-                with memfile_mask.open() as dataset_mask:   
-                    img_array_mask = dataset_mask.read()  # Shape: (1, height, width)
-                    img_array_mask = img_array_mask.astype(np.uint8)
-                    # reorder bands to be in the correct order for matplotlib                      
-                    img_array_mask = np.moveaxis(img_array_mask, 0, -1)  # Shape: (height, width, bands)
+
+            # The structured array (one field per band) is converted to the
+            # (height, width, bands) order used by matplotlib
+            img_array = structured_to_unstructured(pixels)
+
+            valid = np.all(img_array != masked_value, axis=-1)  # Shape: (height, width)
+            if image_quantize:
+                # Back to the image's values (0 and 254 map exactly to vmin and vmax)
+                img_array = img_array.astype(np.float32) * (image_vmax - image_vmin) / 254 + image_vmin
 
             if image_cmap is None:
-                if np.all((img_array == 0) | (img_array == 1)):
+                if np.all((img_array[valid] == 0) | (img_array[valid] == 1)):
                     image_cmap='binary'
                 else:
                     image_cmap='grey'
 
+            # Colour the image ourselves as uint8 RGBA, with the mask as the
+            # alpha channel, so matplotlib does not have to build and normalize
+            # a float masked array. The raster is already on the map's UTM grid
+            # (transform is the axes projection, so cartopy does not regrid it)
+            # and only needs nearest-neighbour resampling to the output pixels.
             ax.imshow(
-                np.ma.masked_where(img_array_mask == 0, img_array),
-                extent=[bounds.left, bounds.right, bounds.bottom, bounds.top],
+                _to_rgba(img_array, valid, image_cmap, image_vmin, image_vmax),
+                extent=[left, right, bottom, top],
                 origin='upper',
                 transform=proj,
-                vmin=image_vmin,
-                vmax=image_vmax,
-                cmap=image_cmap
+                interpolation='nearest',
             )
         
+        # Request the image with about dpi * 4 pixels across the country, rounded
+        # to a whole number of output pixels per image pixel so that every image
+        # pixel covers the same number of output pixels
         image_dimension_pixels = dpi * 4
-        scale = max(x_range, y_range) / image_dimension_pixels
+        pixels_per_image_pixel = math.ceil(
+            max(x_range, y_range) / image_dimension_pixels / pixel_size
+        )
+        scale = pixels_per_image_pixel * pixel_size
 
         add_ee_image(
             ee_image,
-            ee_region,
+            region_coords,
             scale=scale,
             clip_ee_image=clip_ee_image,
             image_cmap=image_cmap
@@ -346,8 +621,14 @@ def create_country_map(
  
     if show_border:
         geometry_kwargs.setdefault("facecolor", 'none')
+        # Vertices closer than half an output pixel are invisible, so drop them
+        # (in degrees, about 111 km each) before the boundary is reprojected and
+        # matplotlib has to transform and stroke the path
+        border_geometry = _transform_geometry(
+            shapely.simplify(country_geometry, pixel_size / 2 / 111_320), utm_epsg
+        )
         ax.add_geometries(
-            [country_geometry_utm],
+            [border_geometry],
             proj,
             **geometry_kwargs
         )
@@ -358,18 +639,73 @@ def create_country_map(
         spine.set_visible(False)
 
     if title:  # Only add title if not empty string
-        plt.title(title, fontsize=16, fontweight='bold')
+        ax.set_title(title, fontsize=16, fontweight='bold')
 
     # plt.show()
 
     # Save the figure
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(output_path, dpi=dpi)
 
     return output_path
 
 
+def create_country_maps(
+    country_codes: list[str],
+    output_dir: str = None,
+    max_workers: int = None,
+    ee_project: str = None,
+    **kwargs,
+) -> list[str]:
+    """
+    Create PNG maps of several countries in parallel.
+
+    Each map is created by create_country_map() in a separate process, since
+    rendering is CPU bound and matplotlib does not release the GIL.
+
+    Parameters
+    ----------
+    country_codes : list[str]
+        ISO 3166-1 alpha-2 country codes.
+    output_dir : str, optional
+        Directory where the PNG files are saved as '{country_code}.png'.
+        If None, they are saved in the current directory.
+    max_workers : int, optional
+        Maximum number of worker processes. Defaults to the number of CPUs.
+    ee_project : str, optional
+        Earth Engine project to initialize in each worker process (with the
+        high volume endpoint), required when passing an ee_image. If None,
+        Earth Engine is not initialized.
+    **kwargs
+        Additional keyword arguments passed to create_country_map(). They must
+        be picklable.
+
+    Returns
+    -------
+    list[str]
+        Paths to the saved PNG files, in the same order as country_codes
+
+    Examples
+    --------
+    >>> create_country_maps(['SG', 'FR'], 'maps')
+    ['maps/sg.png', 'maps/fr.png']
+    """
+    output_paths = [
+        os.path.join(output_dir or '', f"{code.lower()}.png") for code in country_codes
+    ]
+    if ee_project is not None:
+        # Initialize Earth Engine once per worker, rather than once per map
+        from gee_redlist.ee_auth import initialize_ee
+        executor_kwargs = dict(initializer=initialize_ee, initargs=(ee_project, True))
+    else:
+        executor_kwargs = {}
+    with ProcessPoolExecutor(max_workers=max_workers, **executor_kwargs) as executor:
+        return list(executor.map(
+            functools.partial(create_country_map, **kwargs),
+            country_codes,
+            output_paths,
+        ))
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
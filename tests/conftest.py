@@ -0,0 +1,53 @@
+"""Shared pytest fixtures."""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ee_session():
+    """Initialize Earth Engine once for the whole test session.
+
+    Tests using this fixture are skipped if Earth Engine is not authenticated.
+    A skip in a session-scoped fixture is cached, so the credentials are only
+    looked up once even when they are missing.
+
+    Set GEE_HIGHVOLUME=1 to run the integration tests against the high volume
+    endpoint.
+    """
+    from gee_redlist.ee_auth import initialize_ee
+
+    try:
+        initialize_ee(
+            'goog-rle-assessments',
+            high_volume=os.environ.get('GEE_HIGHVOLUME') == '1',
+        )
+    except Exception:
+        pytest.skip("Earth Engine not authenticated - skipping integration tests")
+
+
+def _delete_asset_quietly(asset_id):
+    """Delete an Earth Engine asset, ignoring errors (e.g. if it was never created)."""
+    import ee
+
+    try:
+        ee.data.deleteAsset(asset_id)
+    except ee.EEException:
+        pass
+
+
+@pytest.fixture(scope="session")
+def asset_registry(ee_session):
+    """Collect Earth Engine assets created by tests and delete them at the end.
+
+    Tests add asset IDs to the returned set. The assets are deleted
+    concurrently once the session finishes, rather than one blocking request
+    at the end of each test.
+    """
+    assets = set()
+    yield assets
+    if assets:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_delete_asset_quietly, assets))
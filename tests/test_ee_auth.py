@@ -3,40 +3,89 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import ee
-from gee_redlist.ee_auth import check_authentication, is_authenticated, print_authentication_status
+from google.auth.exceptions import DefaultCredentialsError
+from gee_redlist.ee_auth import (
+    check_authentication,
+    initialize_ee,
+    invalidate_authentication_cache,
+    is_authenticated,
+    print_authentication_status,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_cache():
+    """Start every test without a cached authentication result."""
+    invalidate_authentication_cache()
+    yield
+    invalidate_authentication_cache()
 
 
 class TestAuthenticationFunctions:
     """Test suite for Earth Engine authentication functions."""
 
-    @patch('gee_redlist.ee_auth.ee.Initialize')
-    @patch('gee_redlist.ee_auth.ee.data.getAssetRoots')
+    @patch('ee.Initialize')
+    @patch('ee.data.getAssetRoots')
     def test_successful_authentication(self, mock_get_roots, mock_initialize):
         """Test successful authentication with project info."""
         mock_initialize.return_value = None
         mock_get_roots.return_value = [{'id': 'projects/test-project'}]
 
-        result = check_authentication()
+        result = check_authentication(resolve_project=True)
 
         assert result['authenticated'] is True
         assert 'Successfully authenticated' in result['message']
-        assert result['project'] is not None
+        assert result['project'] == 'test-project'
         mock_initialize.assert_called_once()
 
-    @patch('gee_redlist.ee_auth.ee.Initialize')
-    @patch('gee_redlist.ee_auth.ee.data.getAssetRoots')
+    @patch('ee.Initialize')
+    @patch('ee.data.getAssetRoots')
+    def test_project_from_legacy_asset_root(self, mock_get_roots, mock_initialize):
+        """Test that asset roots without a 'projects/' prefix are used as-is."""
+        mock_get_roots.return_value = [{'id': 'users/someone'}]
+
+        result = check_authentication(resolve_project=True)
+
+        assert result['project'] == 'users/someone'
+
+    @patch('ee.Initialize')
+    @patch('ee.Number')
+    @patch('ee.data.getAssetRoots')
+    def test_authentication_probe_skips_project_lookup(self, mock_get_roots, mock_number, mock_initialize):
+        """Test that the default check verifies credentials without listing asset roots."""
+        result = check_authentication()
+
+        assert result['authenticated'] is True
+        assert result['project'] is None
+        mock_number.assert_called_once_with(1)
+        mock_number.return_value.getInfo.assert_called_once()
+        mock_get_roots.assert_not_called()
+
+    @patch('ee.Initialize')
+    @patch('ee.Number')
+    def test_authentication_probe_failure(self, mock_number, mock_initialize):
+        """Test that a failing verification probe reports not authenticated."""
+        mock_number.return_value.getInfo.side_effect = ee.EEException("Invalid credentials")
+
+        result = check_authentication()
+
+        assert result['authenticated'] is False
+        assert 'Invalid credentials' in result['message']
+
+    @patch('ee.Initialize')
+    @patch('ee.data.getAssetRoots')
     def test_authentication_without_project_info(self, mock_get_roots, mock_initialize):
         """Test authentication succeeds but can't get project info."""
         mock_initialize.return_value = None
-        mock_get_roots.side_effect = Exception("Cannot retrieve project")
+        mock_get_roots.side_effect = ee.EEException("Cannot retrieve project")
 
-        result = check_authentication()
+        result = check_authentication(resolve_project=True)
 
         assert result['authenticated'] is True
         assert 'could not retrieve project info' in result['message']
         assert result['project'] is None
 
-    @patch('gee_redlist.ee_auth.ee.Initialize')
+    @patch('ee.Initialize')
     def test_authentication_ee_exception(self, mock_initialize):
         """Test authentication fails with EE exception."""
         mock_initialize.side_effect = ee.EEException("Authentication required")
@@ -47,10 +96,10 @@ class TestAuthenticationFunctions:
         assert 'Earth Engine authentication failed' in result['message']
         assert result['project'] is None
 
-    @patch('gee_redlist.ee_auth.ee.Initialize')
-    def test_authentication_generic_exception(self, mock_initialize):
-        """Test authentication fails with generic exception."""
-        mock_initialize.side_effect = RuntimeError("Network error")
+    @patch('ee.Initialize')
+    def test_authentication_google_auth_exception(self, mock_initialize):
+        """Test authentication fails with a Google credentials exception."""
+        mock_initialize.side_effect = DefaultCredentialsError("No credentials found")
 
         result = check_authentication()
 
@@ -58,6 +107,93 @@ class TestAuthenticationFunctions:
         assert 'Authentication error' in result['message']
         assert result['project'] is None
 
+    @patch('ee.Initialize')
+    def test_authentication_unexpected_exception(self, mock_initialize):
+        """Test that exceptions unrelated to authentication propagate."""
+        mock_initialize.side_effect = RuntimeError("Unexpected error")
+
+        with pytest.raises(RuntimeError, match="Unexpected error"):
+            check_authentication()
+
+    @patch('ee.Initialize')
+    @patch('ee.data.getAssetRoots')
+    def test_successful_authentication_is_cached(self, mock_get_roots, mock_initialize):
+        """Test that a successful result is reused without further EE calls."""
+        mock_get_roots.return_value = [{'id': 'projects/test-project'}]
+
+        first = check_authentication(resolve_project=True)
+        second = check_authentication(resolve_project=True)
+
+        assert first == second
+        assert second['project'] == 'test-project'
+        mock_initialize.assert_called_once()
+        mock_get_roots.assert_called_once()
+
+    @patch('ee.Initialize')
+    def test_failed_authentication_is_not_cached(self, mock_initialize):
+        """Test that a failed result is probed again on the next call."""
+        mock_initialize.side_effect = ee.EEException("Authentication required")
+
+        check_authentication()
+        check_authentication()
+
+        assert mock_initialize.call_count == 2
+
+    @patch('ee.Initialize')
+    @patch('ee.Number')
+    @patch('ee.data.getAssetRoots')
+    def test_is_authenticated_reuses_project_check(self, mock_get_roots, mock_number, mock_initialize):
+        """Test that is_authenticated reuses a cached check that resolved the project."""
+        mock_get_roots.return_value = [{'id': 'projects/test-project'}]
+
+        check_authentication(resolve_project=True)
+
+        assert is_authenticated() is True
+        mock_initialize.assert_called_once()
+        mock_get_roots.assert_called_once()
+        mock_number.assert_not_called()
+
+    @patch('ee.Initialize')
+    @patch('ee.data.getAssetRoots')
+    def test_invalidate_authentication_cache(self, mock_get_roots, mock_initialize):
+        """Test that invalidating the cache forces a new check."""
+        mock_get_roots.return_value = [{'id': 'projects/test-project'}]
+
+        check_authentication(resolve_project=True)
+        invalidate_authentication_cache()
+        check_authentication(resolve_project=True)
+
+        assert mock_initialize.call_count == 2
+        assert mock_get_roots.call_count == 2
+
+    @patch('google.auth.default')
+    @patch('ee.Initialize')
+    def test_initialize_ee_default_endpoint(self, mock_initialize, mock_default):
+        """Test that initialize_ee uses the default endpoint unless asked otherwise."""
+        credentials = MagicMock()
+        mock_default.return_value = (credentials, None)
+
+        initialize_ee('test-project')
+
+        mock_initialize.assert_called_once_with(
+            credentials=credentials, project='test-project', opt_url=None
+        )
+
+    @patch('google.auth.default')
+    @patch('ee.Initialize')
+    def test_initialize_ee_high_volume(self, mock_initialize, mock_default):
+        """Test that high_volume selects the high volume endpoint."""
+        credentials = MagicMock()
+        mock_default.return_value = (credentials, None)
+
+        initialize_ee('test-project', high_volume=True)
+
+        mock_initialize.assert_called_once_with(
+            credentials=credentials,
+            project='test-project',
+            opt_url='https://earthengine-highvolume.googleapis.com',
+        )
+
     @patch('gee_redlist.ee_auth.check_authentication')
     def test_is_authenticated_true(self, mock_test_auth):
         """Test is_authenticated returns True when authenticated."""
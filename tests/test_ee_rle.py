@@ -1,10 +1,11 @@
 """Tests for ee_rle module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, create_autospec
+from types import SimpleNamespace
+import uuid
 import ee
 from gee_redlist import ee_rle
-from google.auth import default
 
 
 # Test geometry coordinates - region in Asia
@@ -16,124 +17,408 @@ TEST_GEOMETRY_COORDS = [[[96.90049099947396, 28.66344485978154],
                           [97.38422117062748, 28.654760045064048]]]
 
 
+def unique_asset_suffix():
+    """Get a suffix for test asset names that is unique across concurrent test runs."""
+    return uuid.uuid4().hex[:12]
+
+
 def get_test_geometry():
     """Get test geometry (only call after ee.Initialize())."""
     return ee.Geometry.Polygon(TEST_GEOMETRY_COORDS)
 
 
+@pytest.fixture(scope="module", name="test_geometry")
+def fixture_test_geometry(ee_session):
+    """Test geometry shared by the integration tests (ee.Geometry is immutable)."""
+    return get_test_geometry()
+
+
+@pytest.fixture(autouse=True)
+def clear_ee_rle_caches():
+    """Start every test with empty EOO, projection and asset caches."""
+    caches = [
+        ee_rle.make_eoo,
+        ee_rle.make_eoo_cached,
+        ee_rle.get_aoo_grid_projection,
+        ee_rle._list_child_assets,
+    ]
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+@pytest.fixture
+def eoo_mock_chain():
+    """Mock image wired through make_eoo's 'vectors' chain of calls.
+
+    selfMask -> reduceToVectors -> geometry -> convexHull, plus the
+    projection's nominalScale. Tests only need to set
+    nominal_scale.getInfo.return_value.
+    """
+    chain = SimpleNamespace(
+        # Autospec checks make_eoo's calls against the real ee.Image signatures
+        image=create_autospec(ee.Image, instance=True),
+        masked=Mock(),
+        vectors=Mock(),
+        geometry=Mock(),
+        hull=Mock(),
+        projection=Mock(),
+        nominal_scale=Mock(),
+    )
+    chain.image.selfMask.return_value = chain.masked
+    chain.masked.reduceToVectors.return_value = chain.vectors
+    chain.vectors.geometry.return_value = chain.geometry
+    chain.geometry.convexHull.return_value = chain.hull
+    chain.image.projection.return_value = chain.projection
+    chain.projection.nominalScale.return_value = chain.nominal_scale
+    return chain
+
+
 class TestMakeEOO:
     """Tests for the make_eoo function."""
 
     @patch('gee_redlist.ee_rle.ee')
-    def test_make_eoo_basic(self, mock_ee):
+    def test_make_eoo_basic(self, mock_ee, eoo_mock_chain):
         """Test that make_eoo calls the correct Earth Engine methods."""
-        # Create mock objects for the chain of method calls
-        mock_image = Mock()
-        mock_masked = Mock()
-        mock_vectors = Mock()
-        mock_geometry = Mock()
-        mock_hull = Mock()
-        mock_projection = Mock()
-        mock_nominal_scale = Mock()
-
-        # Setup the chain of method calls
-        mock_image.updateMask.return_value = mock_masked
-        mock_masked.reduceToVectors.return_value = mock_vectors
-        mock_vectors.geometry.return_value = mock_geometry
-        mock_geometry.convexHull.return_value = mock_hull
-
-        # Mock the projection and nominal scale
-        mock_image.projection.return_value = mock_projection
-        mock_projection.nominalScale.return_value = mock_nominal_scale
-        mock_nominal_scale.getInfo.return_value = 100  # Return 100m scale
+        chain = eoo_mock_chain
+        chain.nominal_scale.getInfo.return_value = 100  # Return 100m scale
 
         # Create a mock geometry for the region
         mock_geo = Mock()
 
         # Call the function
-        result = ee_rle.make_eoo(mock_image, mock_geo)
+        result = ee_rle.make_eoo(chain.image, mock_geo, method='vectors')
 
         # Verify the chain of calls
-        mock_image.updateMask.assert_called_once_with(1)
-        mock_image.projection.assert_called_once()
-        mock_projection.nominalScale.assert_called_once()
-        mock_nominal_scale.getInfo.assert_called_once()
+        chain.image.selfMask.assert_called_once_with()
+        chain.image.projection.assert_called_once()
+        chain.projection.nominalScale.assert_called_once()
+        chain.nominal_scale.getInfo.assert_called_once()
 
-        mock_masked.reduceToVectors.assert_called_once_with(
+        chain.masked.reduceToVectors.assert_called_once_with(
             scale=100,  # Should use the nominal scale (100m)
+            crs='EPSG:4326',
             geometry=mock_geo,
             geometryType='polygon',
             maxPixels=1e12,  # Default maxPixels parameter
-            bestEffort=False  # Default changed from True to False
+            bestEffort=False,  # Default changed from True to False
+            tileScale=4  # Default tileScale parameter
         )
-        mock_vectors.geometry.assert_called_once()
+        chain.vectors.geometry.assert_called_once()
         # convexHull is called twice (workaround for GEE bug), so we check it was called with maxError=1
-        mock_geometry.convexHull.assert_called_with(maxError=1)
+        chain.geometry.convexHull.assert_called_with(maxError=1)
 
     @patch('gee_redlist.ee_rle.ee')
-    def test_make_eoo_custom_parameters(self, mock_ee):
+    def test_make_eoo_custom_parameters(self, mock_ee, eoo_mock_chain):
         """Test make_eoo with custom parameters."""
-        mock_image = Mock()
-        mock_masked = Mock()
-        mock_vectors = Mock()
-        mock_geometry = Mock()
-        mock_hull = Mock()
-        mock_projection = Mock()
-        mock_nominal_scale = Mock()
-
-        mock_image.updateMask.return_value = mock_masked
-        mock_masked.reduceToVectors.return_value = mock_vectors
-        mock_vectors.geometry.return_value = mock_geometry
-        mock_geometry.convexHull.return_value = mock_hull
-
-        # Mock the projection and nominal scale (return a small scale)
-        mock_image.projection.return_value = mock_projection
-        mock_projection.nominalScale.return_value = mock_nominal_scale
-        mock_nominal_scale.getInfo.return_value = 30  # Return 30m scale (< 50m)
+        chain = eoo_mock_chain
+        chain.nominal_scale.getInfo.return_value = 30  # Return 30m scale (< 50m)
 
         mock_geo = Mock()
 
         # Call with custom parameters
         result = ee_rle.make_eoo(
-            mock_image,
+            chain.image,
             mock_geo,
             max_error=10,
-            best_effort=True  # Test with True instead of default False
+            best_effort=True,  # Test with True instead of default False
+            method='vectors',
+            tile_scale=8
         )
 
         # Verify custom parameters were passed correctly
-        mock_masked.reduceToVectors.assert_called_once_with(
+        chain.masked.reduceToVectors.assert_called_once_with(
             scale=50,  # Should use minimum of 50m (not the 30m nominal scale)
+            crs='EPSG:4326',
             geometry=mock_geo,
             geometryType='polygon',
             maxPixels=1e12,  # Default maxPixels parameter
-            bestEffort=True  # Custom parameter
+            bestEffort=True,  # Custom parameter
+            tileScale=8  # Custom parameter
         )
         # convexHull is called twice, check it was called with custom maxError
-        mock_geometry.convexHull.assert_called_with(maxError=10)
+        chain.geometry.convexHull.assert_called_with(maxError=10)
 
     @patch('gee_redlist.ee_rle.ee')
-    def test_make_eoo_returns_geometry(self, mock_ee):
+    def test_make_eoo_returns_geometry(self, mock_ee, eoo_mock_chain):
         """Test that make_eoo returns an ee.Geometry object."""
+        chain = eoo_mock_chain
+        chain.nominal_scale.getInfo.return_value = 100
+
+        # convexHull is called twice
+        mock_hull_final = Mock()
+        chain.hull.convexHull.return_value = mock_hull_final
+
+        result = ee_rle.make_eoo(chain.image, Mock(), method='vectors')
+
+        assert result == mock_hull_final
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_points_method(self, mock_ee):
+        """Test that the default method hulls the per-row presence extremes."""
         mock_image = Mock()
         mock_geo = Mock()
-        mock_hull = Mock()
-        mock_hull_final = Mock()
-        mock_projection = Mock()
-        mock_nominal_scale = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 100
 
-        # Mock the projection and nominal scale
-        mock_image.projection.return_value = mock_projection
-        mock_projection.nominalScale.return_value = mock_nominal_scale
-        mock_nominal_scale.getInfo.return_value = 100
+        mock_lonlat = mock_ee.Image.pixelLonLat.return_value.addBands.return_value.updateMask.return_value
+        mock_hull = mock_ee.Geometry.MultiPoint.return_value.convexHull.return_value
 
-        # Setup the full chain - convexHull is called twice
-        mock_hull.convexHull.return_value = mock_hull_final
-        mock_image.updateMask.return_value.reduceToVectors.return_value.geometry.return_value.convexHull.return_value = mock_hull
+        result = ee_rle.make_eoo(mock_image, mock_geo, max_error=10)
 
-        result = ee_rle.make_eoo(mock_image, mock_geo)
+        # Pixels are projected at the reduction scale and masked on the class image
+        mock_ee.Projection.return_value.atScale.assert_called_once_with(100)
+        mock_ee.Image.pixelLonLat.return_value.addBands.return_value.updateMask.assert_called_once_with(mock_image)
 
-        assert result == mock_hull_final
+        # A single grouped reduction replaces reduceToVectors
+        mock_image.selfMask.assert_not_called()
+        call_kwargs = mock_lonlat.reduceRegion.call_args[1]
+        assert call_kwargs['geometry'] == mock_geo
+        assert call_kwargs['crs'] == mock_ee.Projection.return_value.atScale.return_value
+        assert call_kwargs['maxPixels'] == 1e12
+        assert call_kwargs['bestEffort'] is False
+        assert call_kwargs['tileScale'] == 4
+
+        mock_ee.Geometry.MultiPoint.assert_called_once()
+        assert mock_ee.Geometry.MultiPoint.call_args[1] == {'proj': 'EPSG:4326'}
+        mock_ee.Geometry.MultiPoint.return_value.convexHull.assert_called_once_with(maxError=10)
+        assert result == mock_hull
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_custom_projection(self, mock_ee):
+        """Test that a precomputed crs and crs_transform are forwarded."""
+        mock_image = Mock()
+        mock_geo = Mock()
+        mock_masked = mock_image.selfMask.return_value
+        crs_transform = [30, 0, 90, 0, -30, 30]
+
+        ee_rle.make_eoo(
+            mock_image,
+            mock_geo,
+            method='vectors',
+            crs='EPSG:32647',
+            crs_transform=crs_transform,
+        )
+
+        # The transform fixes the grid, so the nominal scale is not requested
+        mock_image.projection.assert_not_called()
+        mock_masked.reduceToVectors.assert_called_once_with(
+            crsTransform=crs_transform,
+            crs='EPSG:32647',
+            geometry=mock_geo,
+            geometryType='polygon',
+            maxPixels=1e12,
+            bestEffort=False,
+            tileScale=4
+        )
+
+    def test_make_eoo_points_rejects_projection(self):
+        """Test that crs is rejected for the points method."""
+        with pytest.raises(ValueError, match="only supported by method='vectors'"):
+            ee_rle.make_eoo(Mock(), Mock(), crs='EPSG:32647')
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_cached(self, mock_ee):
+        """Test that repeated calls with the same inputs reuse the hull."""
+        mock_image = Mock()
+        mock_geo = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 100
+
+        first = ee_rle.make_eoo(mock_image, mock_geo)
+        second = ee_rle.make_eoo(mock_image, geo=mock_geo)
+
+        assert first is second
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.assert_called_once()
+        mock_ee.Geometry.MultiPoint.assert_called_once()
+
+        # Different arguments build a new hull
+        ee_rle.make_eoo(mock_image, mock_geo, max_error=10)
+        assert mock_ee.Geometry.MultiPoint.call_count == 2
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_cache_is_bounded(self, mock_ee):
+        """Test that the least recently used hulls are evicted from the cache."""
+        maxsize = ee_rle.make_eoo.cache_info().maxsize
+        mock_geo = Mock()
+
+        for max_error in range(maxsize + 1):
+            ee_rle.make_eoo(Mock(), mock_geo, scale=100, max_error=max_error)
+
+        assert ee_rle.make_eoo.cache_info().currsize == maxsize
+
+    def test_graph_cache_key_uses_serialization(self):
+        """Test that EE objects are keyed on their serialized graph."""
+        mock_image = Mock()
+        mock_image.serialize.return_value = '{"graph": 1}'
+
+        assert ee_rle._graph_cache_key(mock_image) == '{"graph": 1}'
+        assert ee_rle._graph_cache_key([1, 2]) == (1, 2)
+        assert ee_rle._graph_cache_key(None) is None
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_qhull_method(self, mock_ee):
+        """Test that the qhull method hulls the row extremes locally."""
+        mock_image = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 100
+        mock_points = mock_ee.List.return_value.map.return_value.zip.return_value.cat.return_value
+        # West and east extremes of three rows, plus an interior point
+        mock_points.getInfo.return_value = [
+            [0.0, 0.0], [0.0, 1.0], [0.0, 2.0],
+            [2.0, 0.0], [1.0, 1.0], [2.0, 2.0],
+        ]
+
+        result = ee_rle.make_eoo(mock_image, Mock(), method='qhull')
+
+        mock_points.getInfo.assert_called_once()
+        mock_ee.Geometry.MultiPoint.assert_not_called()
+        args, kwargs = mock_ee.Geometry.Polygon.call_args
+        assert sorted(map(tuple, args[0][0])) == [(0.0, 0.0), (0.0, 2.0), (2.0, 0.0), (2.0, 2.0)]
+        assert kwargs == {'proj': 'EPSG:4326', 'geodesic': False}
+        assert result == mock_ee.Geometry.Polygon.return_value
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_qhull_degenerate(self, mock_ee):
+        """Test that degenerate point sets fall back to the EE hull."""
+        mock_image = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 100
+        mock_points = mock_ee.List.return_value.map.return_value.zip.return_value.cat.return_value
+        mock_points.getInfo.return_value = [[0.0, 0.0], [1.0, 0.0]]
+
+        result = ee_rle.make_eoo(mock_image, Mock(), method='qhull')
+
+        mock_ee.Geometry.Polygon.assert_not_called()
+        mock_ee.Geometry.MultiPoint.assert_called_once_with(
+            [[0.0, 0.0], [1.0, 0.0]], proj='EPSG:4326'
+        )
+        assert result == mock_ee.Geometry.MultiPoint.return_value.convexHull.return_value
+
+    def test_make_eoo_invalid_method(self):
+        """Test that an unknown method raises ValueError."""
+        with pytest.raises(ValueError, match="method must be 'points', 'qhull' or 'vectors'"):
+            ee_rle.make_eoo(Mock(), Mock(), method='raster')
+
+
+class TestMakeEOOCached:
+    """Tests for the make_eoo_cached function."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_cached_by_key(self, mock_ee):
+        """Test that calls with the same key and arguments are computed once."""
+        mock_image = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 30
+
+        first = ee_rle.make_eoo_cached('species-1', mock_image, max_error=10)
+        second = ee_rle.make_eoo_cached('species-1', mock_image, max_error=10)
+
+        assert first is second
+        # The inputs are looked up by key, not by their serialized graphs
+        mock_image.serialize.assert_not_called()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.assert_called_once()
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_different_arguments_not_shared(self, mock_ee):
+        """Test that different keys or arguments are cached separately."""
+        mock_image = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 30
+
+        ee_rle.make_eoo_cached('species-1', mock_image)
+        ee_rle.make_eoo_cached('species-2', mock_image)
+        ee_rle.make_eoo_cached('species-1', mock_image, best_effort=True)
+
+        assert mock_image.projection.return_value.nominalScale.return_value.getInfo.call_count == 3
+
+
+class TestMakeEOOByClass:
+    """Tests for the make_eoo_by_class function."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_single_vectorization(self, mock_ee):
+        """Test that all classes share a single reduceToVectors call."""
+        mock_image = Mock()
+        mock_geo = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 30
+        mock_masked = mock_image.updateMask.return_value
+
+        result = ee_rle.make_eoo_by_class(
+            mock_image, [37, 52], mock_geo, method='vectors'
+        )
+
+        # Pixels of other classes are masked out before vectorizing
+        mock_image.remap.assert_called_once_with([37, 52], [1, 1], 0)
+        mock_image.updateMask.assert_called_once_with(mock_image.remap.return_value)
+        mock_masked.reduceToVectors.assert_called_once_with(
+            scale=50,
+            crs='EPSG:4326',
+            geometry=mock_geo,
+            geometryType='polygon',
+            labelProperty='label',
+            maxPixels=1e12,
+            bestEffort=False,
+            tileScale=4,
+        )
+
+        # One hull per label, keyed by the label as a string
+        mock_ee.List.assert_called_once_with([37, 52])
+        mock_ee.Dictionary.fromLists.assert_called_once_with(
+            ['37', '52'], mock_ee.List.return_value.map.return_value
+        )
+        assert result == mock_ee.Dictionary.fromLists.return_value
+
+    @patch('gee_redlist.ee_rle._presence_row_extremes')
+    @patch('gee_redlist.ee_rle.ee')
+    def test_points_method_skips_vectorization(self, mock_ee, mock_extremes):
+        """Test that the default method hulls per-class row extremes."""
+        mock_image = Mock()
+        mock_geo = Mock()
+        mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 100
+
+        result = ee_rle.make_eoo_by_class(mock_image, [37, 52], mock_geo)
+
+        mock_image.reduceToVectors.assert_not_called()
+        mock_image.updateMask.assert_not_called()
+
+        # Run the server-side per-class function for one label
+        class_hull = mock_ee.List.return_value.map.call_args[0][0]
+        class_hull(37)
+        mock_image.eq.assert_called_once_with(mock_ee.Number.return_value)
+        mock_extremes.assert_called_once_with(
+            mock_image.eq.return_value, mock_geo, 100, 1e12, False, 4
+        )
+        mock_ee.Geometry.MultiPoint.assert_called_once_with(
+            mock_extremes.return_value, proj='EPSG:4326'
+        )
+        assert result == mock_ee.Dictionary.fromLists.return_value
+
+    def test_invalid_method(self):
+        """Test that an unknown method is rejected."""
+        with pytest.raises(ValueError, match="method must be"):
+            ee_rle.make_eoo_by_class(Mock(), [1], method='qhull')
+
+
+class TestAooGridProjection:
+    """Tests for the AOO grid projection helpers."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_projection_is_reused(self, mock_ee):
+        """Test that the projection is only constructed once."""
+        first = ee_rle.get_aoo_grid_projection()
+        second = ee_rle.get_aoo_grid_projection()
+
+        assert first is second
+        mock_ee.Projection.assert_called_once()
+        assert mock_ee.Projection.call_args[1]['transform'] == [1e4, 0, 0, 0, 1e4, 0]
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_export_uses_local_wkt(self, mock_ee):
+        """Test that exports pass the local WKT without a getInfo round trip."""
+        ee_rle.build_fractional_coverage_export_task(
+            Mock(), 'projects/test/assets/grid', 'test_export'
+        )
+
+        mock_ee.Projection.return_value.getInfo.assert_not_called()
+        call_kwargs = mock_ee.batch.Export.image.toAsset.call_args[1]
+        assert call_kwargs['crs'] == ee_rle._WKT_54034
 
 
 class TestAreaKm2:
@@ -171,20 +456,100 @@ class TestAreaKm2:
         assert result == mock_result
 
 
+class TestAreaKm2Many:
+    """Tests for the area_km2_many function."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_area_km2_many_single_request(self, mock_ee):
+        """Test that all areas are evaluated with one getInfo call."""
+        mock_polys = [Mock(), Mock(), Mock()]
+        mock_ee.List.return_value.getInfo.return_value = [1.0, 2.0, 3.0]
+
+        result = ee_rle.area_km2_many(mock_polys)
+
+        # Each area is built lazily and combined into one list
+        for poly in mock_polys:
+            poly.area.return_value.divide.assert_called_once_with(1e6)
+        mock_ee.List.assert_called_once_with(
+            [poly.area.return_value.divide.return_value for poly in mock_polys]
+        )
+        mock_ee.List.return_value.getInfo.assert_called_once()
+        assert result == [1.0, 2.0, 3.0]
+
+
+class TestEooAreasKm2:
+    """Tests for the eoo_areas_km2 function."""
+
+    @patch('gee_redlist.ee_rle.make_eoo_by_class')
+    def test_eoo_areas_single_request(self, mock_make_eoo_by_class):
+        """Test that all class areas are evaluated with one getInfo call."""
+        mock_image = Mock()
+        mock_eoos = mock_make_eoo_by_class.return_value
+        mock_eoos.map.return_value.getInfo.return_value = {'37': 1.5, '52': 2.5}
+
+        result = ee_rle.eoo_areas_km2(mock_image, [37, 52], scale=100)
+
+        mock_make_eoo_by_class.assert_called_once_with(mock_image, [37, 52], scale=100)
+        mock_eoos.map.return_value.getInfo.assert_called_once()
+        assert result == {37: 1.5, 52: 2.5}
+
+
+class TestMakeEOOMany:
+    """Tests for the make_eoo_many function."""
+
+    @patch('gee_redlist.ee_rle.make_eoo')
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_many_fetches_scales_once(self, mock_ee, mock_make_eoo):
+        """Test that nominal scales are fetched in a single request."""
+        mock_imgs = [Mock(), Mock()]
+        mock_geos = [Mock(), Mock()]
+        mock_ee.List.return_value.getInfo.return_value = [30, 100]
+
+        result = ee_rle.make_eoo_many(mock_imgs, mock_geos, max_error=10)
+
+        mock_ee.List.return_value.getInfo.assert_called_once()
+        assert mock_make_eoo.call_args_list == [
+            ((mock_imgs[0], mock_geos[0]), {'scale': 50, 'max_error': 10}),
+            ((mock_imgs[1], mock_geos[1]), {'scale': 100, 'max_error': 10}),
+        ]
+        assert result == mock_ee.List.return_value
+
+    @patch('gee_redlist.ee_rle.make_eoo')
+    @patch('gee_redlist.ee_rle.ee')
+    def test_make_eoo_many_with_scale(self, mock_ee, mock_make_eoo):
+        """Test that an explicit scale skips the nominal scale request."""
+        mock_imgs = [Mock(), Mock()]
+
+        ee_rle.make_eoo_many(mock_imgs, scale=100)
+
+        mock_ee.List.return_value.getInfo.assert_not_called()
+        assert mock_make_eoo.call_args_list == [
+            ((mock_imgs[0], None), {'scale': 100}),
+            ((mock_imgs[1], None), {'scale': 100}),
+        ]
+
+    def test_make_eoo_many_mismatched_geos(self):
+        """Test that a geometry count mismatch raises ValueError."""
+        with pytest.raises(ValueError, match="one geometry per image"):
+            ee_rle.make_eoo_many([Mock(), Mock()], [Mock()], scale=100)
+
+
 class TestEnsureAssetFolderExists:
     """Tests for the ensure_asset_folder_exists function."""
 
     @patch('gee_redlist.ee_rle.ee.data')
     def test_folder_already_exists(self, mock_data):
         """Test when folder already exists."""
-        # Setup: getAsset succeeds (folder exists)
-        mock_data.getAsset.return_value = {'type': 'FOLDER', 'id': 'test/folder'}
+        # Setup: the parent listing contains the folder
+        mock_data.listAssets.return_value = {'assets': [
+            {'type': 'FOLDER', 'name': 'projects/test/assets/folder', 'id': 'projects/test/assets/folder'}
+        ]}
 
         # Call the function
         result = ee_rle.ensure_asset_folder_exists('projects/test/assets/folder')
 
-        # Verify getAsset was called
-        mock_data.getAsset.assert_called_once_with('projects/test/assets/folder')
+        # Verify the parent folder was listed
+        mock_data.listAssets.assert_called_once_with({'parent': 'projects/test/assets'})
         # Verify createFolder was NOT called
         mock_data.createFolder.assert_not_called()
         # Verify function returns False (not created)
@@ -193,15 +558,15 @@ class TestEnsureAssetFolderExists:
     @patch('gee_redlist.ee_rle.ee.data')
     def test_folder_does_not_exist(self, mock_data):
         """Test when folder doesn't exist and needs to be created."""
-        # Setup: getAsset raises exception (folder doesn't exist)
-        mock_data.getAsset.side_effect = ee.EEException('Asset not found')
+        # Setup: the parent listing does not contain the folder
+        mock_data.listAssets.return_value = {'assets': []}
         mock_data.createFolder.return_value = {'type': 'FOLDER', 'id': 'test/folder'}
 
         # Call the function
         result = ee_rle.ensure_asset_folder_exists('projects/test/assets/folder')
 
-        # Verify getAsset was called
-        mock_data.getAsset.assert_called_once_with('projects/test/assets/folder')
+        # Verify the parent folder was listed
+        mock_data.listAssets.assert_called_once_with({'parent': 'projects/test/assets'})
         # Verify createFolder WAS called
         mock_data.createFolder.assert_called_once_with('projects/test/assets/folder')
         # Verify function returns True (was created)
@@ -210,7 +575,8 @@ class TestEnsureAssetFolderExists:
     @patch('gee_redlist.ee_rle.ee.data')
     def test_folder_creation_with_ecosystem_code(self, mock_data):
         """Test folder creation with realistic ecosystem folder path."""
-        # Setup: folder doesn't exist
+        # Setup: neither the parent nor the folder exist
+        mock_data.listAssets.side_effect = ee.EEException('Asset not found')
         mock_data.getAsset.side_effect = ee.EEException('Asset not found')
         mock_data.createFolder.return_value = {'type': 'FOLDER'}
 
@@ -221,22 +587,77 @@ class TestEnsureAssetFolderExists:
         mock_data.createFolder.assert_called_once_with(folder_path)
         assert result is True
 
+    @patch('gee_redlist.ee_rle.ee.data')
+    def test_parent_listed_once(self, mock_data):
+        """Test that folders under the same parent share one listing request."""
+        folders = ['projects/test/assets/a', 'projects/test/assets/b']
+        mock_data.listAssets.return_value = {'assets': [
+            {'type': 'FOLDER', 'name': folder, 'id': folder} for folder in folders
+        ]}
+
+        results = [ee_rle.ensure_asset_folder_exists(folder) for folder in folders]
+
+        assert results == [False, False]
+        mock_data.listAssets.assert_called_once()
+
+    @patch('gee_redlist.ee_rle.ee.data')
+    def test_listing_refreshed_after_create(self, mock_data):
+        """Test that creating a folder invalidates the cached parent listing."""
+        created = []
+        mock_data.listAssets.side_effect = lambda params: {'assets': [
+            {'type': 'FOLDER', 'name': folder, 'id': folder} for folder in created
+        ]}
+        mock_data.createFolder.side_effect = created.append
+
+        results = [
+            ee_rle.ensure_asset_folder_exists('projects/test/assets/b'),
+            ee_rle.ensure_asset_folder_exists('projects/test/assets/b'),
+        ]
+
+        assert results == [True, False]
+        assert mock_data.listAssets.call_count == 2
+        mock_data.createFolder.assert_called_once_with('projects/test/assets/b')
+
+    @patch('gee_redlist.ee_rle.ee.data')
+    def test_listing_failure_not_cached(self, mock_data):
+        """Test that a failed listing falls back to getAsset and is retried."""
+        folder_path = 'projects/test/assets/folder'
+        mock_data.listAssets.side_effect = [
+            ee.EEException('Service unavailable'),
+            {'assets': [{'type': 'FOLDER', 'name': folder_path, 'id': folder_path}]},
+        ]
+
+        results = [
+            ee_rle.ensure_asset_folder_exists(folder_path),
+            ee_rle.ensure_asset_folder_exists(folder_path),
+        ]
+
+        # The first check falls back to getAsset, the second lists the parent again
+        assert results == [False, False]
+        mock_data.getAsset.assert_called_once_with(folder_path)
+        assert mock_data.listAssets.call_count == 2
+        mock_data.createFolder.assert_not_called()
+
 
 class TestCreateAssetFolder:
     """Tests for the create_asset_folder function."""
 
+    def test_create_asset_folder_is_alias(self):
+        """Test that create_asset_folder shares the ensure_asset_folder_exists implementation."""
+        assert ee_rle.create_asset_folder is ee_rle.ensure_asset_folder_exists
+
     @patch('gee_redlist.ee_rle.ee.data')
     def test_create_folder_when_not_exists(self, mock_data):
         """Test folder creation when folder doesn't exist."""
-        # Setup: getAsset raises exception (folder doesn't exist)
-        mock_data.getAsset.side_effect = ee.EEException('Asset not found')
+        # Setup: the parent listing does not contain the folder
+        mock_data.listAssets.return_value = {'assets': []}
         mock_data.createFolder.return_value = {'type': 'FOLDER', 'id': 'test/folder'}
 
         # Call the function
         result = ee_rle.create_asset_folder('projects/test/assets/folder')
 
-        # Verify getAsset was called to check existence
-        mock_data.getAsset.assert_called_once_with('projects/test/assets/folder')
+        # Verify the parent folder was listed to check existence
+        mock_data.listAssets.assert_called_once_with({'parent': 'projects/test/assets'})
         # Verify createFolder was called
         mock_data.createFolder.assert_called_once_with('projects/test/assets/folder')
         # Verify function returns True (folder was created)
@@ -245,14 +666,16 @@ class TestCreateAssetFolder:
     @patch('gee_redlist.ee_rle.ee.data')
     def test_create_folder_when_already_exists(self, mock_data):
         """Test folder creation when folder already exists."""
-        # Setup: getAsset succeeds (folder exists)
-        mock_data.getAsset.return_value = {'type': 'FOLDER', 'id': 'test/folder'}
+        # Setup: the parent listing contains the folder (legacy-style ID)
+        mock_data.listAssets.return_value = {'assets': [
+            {'type': 'FOLDER', 'name': 'projects/earthengine-legacy/assets/users/test/folder', 'id': 'users/test/folder'}
+        ]}
 
         # Call the function
-        result = ee_rle.create_asset_folder('projects/test/assets/folder')
+        result = ee_rle.create_asset_folder('users/test/folder')
 
-        # Verify getAsset was called
-        mock_data.getAsset.assert_called_once_with('projects/test/assets/folder')
+        # Verify the parent folder was listed
+        mock_data.listAssets.assert_called_once_with({'parent': 'users/test'})
         # Verify createFolder was NOT called
         mock_data.createFolder.assert_not_called()
         # Verify function returns False (folder already existed)
@@ -262,7 +685,7 @@ class TestCreateAssetFolder:
     def test_create_folder_with_ecosystem_path(self, mock_data):
         """Test folder creation with realistic ecosystem folder path."""
         # Setup: folder doesn't exist
-        mock_data.getAsset.side_effect = ee.EEException('Asset not found')
+        mock_data.listAssets.return_value = {'assets': []}
         mock_data.createFolder.return_value = {'type': 'FOLDER'}
 
         folder_path = 'projects/goog-rle-assessments/assets/MMR-T1_1_2'
@@ -273,26 +696,148 @@ class TestCreateAssetFolder:
         assert result is True
 
 
+class TestFractionalCoverageExport:
+    """Tests for the fractional coverage export functions."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_build_task_does_not_start(self, mock_ee):
+        """Test that building an export task does not start it."""
+        mock_task = mock_ee.batch.Export.image.toAsset.return_value
+
+        task = ee_rle.build_fractional_coverage_export_task(
+            Mock(), 'projects/test/assets/grid', 'test_export'
+        )
+
+        assert task == mock_task
+        mock_task.start.assert_not_called()
+        call_kwargs = mock_ee.batch.Export.image.toAsset.call_args[1]
+        assert call_kwargs['assetId'] == 'projects/test/assets/grid'
+        assert call_kwargs['description'] == 'test_export'
+        assert call_kwargs['crs'] == ee_rle._WKT_54034
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_export_starts_task(self, mock_ee):
+        """Test that export_fractional_coverage_on_aoo_grid starts the task."""
+        mock_task = mock_ee.batch.Export.image.toAsset.return_value
+
+        task = ee_rle.export_fractional_coverage_on_aoo_grid(
+            Mock(), 'projects/test/assets/grid', 'test_export'
+        )
+
+        assert task == mock_task
+        mock_task.start.assert_called_once()
+
+    def test_start_tasks(self):
+        """Test that start_tasks starts every task and preserves order."""
+        tasks = [Mock() for _ in range(5)]
+
+        result = ee_rle.start_tasks(tasks, max_workers=2)
+
+        assert result == tasks
+        for task in tasks:
+            task.start.assert_called_once()
+
+    def test_start_tasks_propagates_errors(self):
+        """Test that a failed start is raised to the caller."""
+        tasks = [Mock(), Mock()]
+        tasks[1].start.side_effect = ee.EEException('Too many tasks')
+
+        with pytest.raises(ee.EEException, match='Too many tasks'):
+            ee_rle.start_tasks(tasks)
+
+
+class TestFractionalCoverageImage:
+    """Tests for the two-stage fractional coverage reduction."""
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_two_stage_reduction(self, mock_ee):
+        """Test that coverage is averaged via an intermediate 100 m grid."""
+        mock_image = Mock()
+        mock_stage1 = mock_image.unmask.return_value.reduceResolution
+        mock_coarse = mock_stage1.return_value.reproject.return_value
+        mock_stage2 = mock_coarse.reduceResolution
+        mock_fcov = mock_stage2.return_value.reproject.return_value
+
+        result = ee_rle._fractional_coverage_image(mock_image, max_pixels=65536)
+
+        mock_image.projection.return_value.atScale.assert_called_once_with(100)
+        mock_stage1.return_value.reproject.assert_called_once_with(
+            mock_image.projection.return_value.atScale.return_value
+        )
+        assert mock_stage2.call_args[1]['maxPixels'] == 65536
+        mock_stage2.return_value.reproject.assert_called_once_with(mock_ee.Projection.return_value)
+        mock_fcov.mask.assert_called_once_with(mock_fcov.gt.return_value)
+        assert result == mock_fcov.mask.return_value
+
+    @patch('gee_redlist.ee_rle.ee')
+    def test_stage1_fits_fine_inputs(self, mock_ee):
+        """Test that stage 1 allows the (100 m / 1 m)^2 pixels of a 1 m mask."""
+        mock_image = Mock()
+        mock_stage1 = mock_image.unmask.return_value.reduceResolution
+
+        ee_rle._fractional_coverage_image(mock_image, max_pixels=65536)
+
+        assert mock_stage1.call_args[1]['maxPixels'] == 65536
+        assert mock_stage1.call_args[1]['maxPixels'] >= (100 / 1) ** 2
+
+
+class TestDownloadFractionalCoverage:
+    """Tests for the fractional coverage download functions."""
+
+    @patch('gee_redlist.ee_rle.requests.get')
+    @patch('gee_redlist.ee_rle.ee')
+    def test_download_streams_geotiff(self, mock_ee, mock_get, tmp_path):
+        """Test that the coverage GeoTIFF is requested and streamed to disk."""
+        mock_image = Mock()
+        mock_coarse = mock_image.unmask.return_value.reduceResolution.return_value.reproject.return_value
+        mock_fcov = mock_coarse.reduceResolution.return_value.reproject.return_value
+        mock_fcov.mask.return_value.getDownloadURL.return_value = 'http://example.com/fcov.tif'
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.iter_content.return_value = [b'II*\x00', b'data']
+        mock_region = Mock()
+        out_path = tmp_path / 'fcov.tif'
+
+        result = ee_rle.download_fractional_coverage_on_aoo_grid(
+            mock_image, str(out_path), region=mock_region
+        )
+
+        assert result == str(out_path)
+        assert out_path.read_bytes() == b'II*\x00data'
+        mock_fcov.mask.return_value.getDownloadURL.assert_called_once_with({
+            'region': mock_region,
+            'format': 'GEO_TIFF',
+            'crs': ee_rle._WKT_54034,
+            'scale': 10000,
+        })
+        mock_get.assert_called_once_with('http://example.com/fcov.tif', stream=True, timeout=300)
+        mock_response.raise_for_status.assert_called_once()
+
+    @patch('gee_redlist.ee_rle.download_fractional_coverage_on_aoo_grid')
+    def test_download_many(self, mock_download):
+        """Test that every image is downloaded to its own path."""
+        mock_download.side_effect = lambda img, path, **kwargs: path
+        mock_imgs = [Mock(), Mock(), Mock()]
+        paths = ['a.tif', 'b.tif', 'c.tif']
+
+        result = ee_rle.download_fractional_coverage_many(mock_imgs, paths, timeout=60)
+
+        assert result == paths
+        assert mock_download.call_count == 3
+        mock_download.assert_any_call(mock_imgs[1], 'b.tif', timeout=60)
+
+    def test_download_many_mismatched_paths(self):
+        """Test that a path count mismatch raises ValueError."""
+        with pytest.raises(ValueError, match="one path per image"):
+            ee_rle.download_fractional_coverage_many([Mock(), Mock()], ['a.tif'])
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("ee_session")
 class TestIntegrationWithRealEE:
     """Integration tests using real Earth Engine objects (requires authentication)."""
 
-    @pytest.fixture(autouse=True)
-    def setup_ee(self):
-        """Initialize Earth Engine before each test."""
-        try:
-            # ee.Initialize()
-            credentials, _ = default(scopes=[
-                'https://www.googleapis.com/auth/earthengine',
-                'https://www.googleapis.com/auth/cloud-platform'
-            ])
-            ee.Initialize(credentials=credentials, project='goog-rle-assessments')
-        except Exception:
-            pytest.skip("Earth Engine not authenticated - skipping integration tests")
-
-    def test_make_eoo_with_real_geometry(self):
-        """Test make_eoo with real Earth Engine geometry."""
-        test_geometry = get_test_geometry()
-
+    def test_make_eoo_and_area_with_real_geometry(self, test_geometry):
+        """Test make_eoo and area_km2 on the same real Earth Engine EOO."""
         # Create a simple binary image covering the test region
         # Using a constant image with value 1 (presence)
         test_image = ee.Image(1).clip(test_geometry)
@@ -303,12 +848,23 @@ class TestIntegrationWithRealEE:
         # Verify result is an ee.Geometry
         assert isinstance(eoo_poly, ee.Geometry)
 
-        # Verify the EOO is not empty (should have computed geometry)
-        eoo_info = eoo_poly.getInfo()
-        assert eoo_info is not None
+        # Verify result is an ee.Number
+        area = ee_rle.area_km2(eoo_poly)
+        assert isinstance(area, ee.Number)
+
+        # Verify the EOO is not empty (should have computed geometry) and has an
+        # area, fetching its type, size and area in one request rather than
+        # computing the EOO once per value
+        eoo_info = ee.Dictionary({
+            'type': eoo_poly.type(),
+            'coords_count': eoo_poly.coordinates().flatten().size(),
+            'area_km2': area,
+        }).getInfo()
         assert eoo_info['type'] in ['Polygon', 'MultiPolygon']
+        assert eoo_info['coords_count'] > 0
+        assert eoo_info['area_km2'] > 0
 
-    def test_area_km2_with_real_geometry(self):
+    def test_area_km2_with_real_geometry(self, test_geometry):
         """Test area_km2 with real Earth Engine geometry.
 
         Test based on:
@@ -318,8 +874,6 @@ class TestIntegrationWithRealEE:
         from the original test value (12634.46 km²) depending on the reduction scale used.
         The test now uses a larger maxError to accommodate the coarser scale.
         """
-        test_geometry = get_test_geometry()
-
         # Create a simple binary image
         elevation = ee.Image('USGS/SRTMGL1_003').clip(test_geometry)
         test_image = ee.Image(1).clip(test_geometry).updateMask(elevation.gte(4500))
@@ -344,17 +898,16 @@ class TestIntegrationWithRealEE:
         assert area_val > 10000, f"Expected area > 10000 km², got {area_val} km²"
         assert area_val < 15000, f"Expected area < 15000 km², got {area_val} km²"
 
-    def test_export_fractional_coverage_on_aoo_grid(self):
+    def test_export_fractional_coverage_on_aoo_grid(self, asset_registry):
         """Test export_fractional_coverage_on_aoo_grid with real Earth Engine objects."""
-        import time
-        test_geometry = get_test_geometry()
-
         # Create a simple binary image covering the test region
         test_image = ee.Image('projects/goog-rle-assessments/assets/mm_ecosys_v7b').eq(52).selfMask()
 
-        # Use a timestamped folder to avoid conflicts
-        test_folder = f'test_export_{int(time.time())}'
+        # Use a uniquely named folder to avoid conflicts
+        test_folder = f'test_export_{unique_asset_suffix()}'
         asset_id = f'projects/goog-rle-assessments/assets/{test_folder}/grid'
+        # The folder is created by the export function; delete it afterwards
+        asset_registry.add(f'projects/goog-rle-assessments/assets/{test_folder}')
 
         # Call the export function (will create the folder automatically)
         task = ee_rle.export_fractional_coverage_on_aoo_grid(
@@ -371,75 +924,48 @@ class TestIntegrationWithRealEE:
         assert task.task_type == 'EXPORT_IMAGE'
         # assert task.state in ['READY', 'RUNNING', 'COMPLETED']
 
-        # Verify the task was created in Earth Engine
-        # We can check the task status
-        task_list = ee.batch.Task.list()
-        task_ids = [task.id for task in task_list]
-        assert task.id in task_ids
+        # Verify the task was created in Earth Engine, by fetching the status of
+        # this task only rather than listing every task in the project
+        assert task.status()['id'] == task.id
 
         # Cancel the task to clean up (we don't actually want to export)
         task.cancel()
 
-        # Clean up: delete the test folder
-        try:
-            folder_path = f'projects/goog-rle-assessments/assets/{test_folder}'
-            ee.data.deleteAsset(folder_path)
-        except Exception:
-            pass  # Ignore errors during cleanup
-
-    def test_ensure_asset_folder_exists_integration(self):
+    def test_ensure_asset_folder_exists_integration(self, asset_registry):
         """Integration test for ensure_asset_folder_exists with real Earth Engine."""
-        import time
-
         # Use a test folder path that we can safely create and delete
-        test_folder = f'projects/goog-rle-assessments/assets/test_folder_{int(time.time())}'
-
-        try:
-            # First call should create the folder
-            result = ee_rle.ensure_asset_folder_exists(test_folder)
-            assert result is True, "First call should create folder and return True"
-
-            # Verify folder was created by checking it exists
-            asset_info = ee.data.getAsset(test_folder)
-            assert asset_info is not None
-            assert asset_info['type'] == 'FOLDER'
-
-            # Second call should find existing folder
-            result = ee_rle.ensure_asset_folder_exists(test_folder)
-            assert result is False, "Second call should find existing folder and return False"
-
-        finally:
-            # Clean up: delete the test folder
-            try:
-                ee.data.deleteAsset(test_folder)
-            except Exception:
-                pass  # Ignore errors during cleanup
-
-    def test_create_asset_folder_integration(self):
-        """Integration test for create_asset_folder with real Earth Engine."""
-        import time
+        test_folder = f'projects/goog-rle-assessments/assets/test_folder_{unique_asset_suffix()}'
+        asset_registry.add(test_folder)
+
+        # First call should create the folder
+        result = ee_rle.ensure_asset_folder_exists(test_folder)
+        assert result is True, "First call should create folder and return True"
 
+        # Verify folder was created by checking it exists
+        asset_info = ee.data.getAsset(test_folder)
+        assert asset_info is not None
+        assert asset_info['type'] == 'FOLDER'
+
+        # Second call should find existing folder
+        result = ee_rle.ensure_asset_folder_exists(test_folder)
+        assert result is False, "Second call should find existing folder and return False"
+
+    def test_create_asset_folder_integration(self, asset_registry):
+        """Integration test for create_asset_folder with real Earth Engine."""
         # Use a test folder path that we can safely create and delete
-        test_folder = f'projects/goog-rle-assessments/assets/test_create_folder_{int(time.time())}'
-
-        try:
-            # First call should create the folder
-            result = ee_rle.create_asset_folder(test_folder)
-            assert result is True, "First call should create folder and return True"
-
-            # Verify folder was actually created by checking it exists
-            asset_info = ee.data.getAsset(test_folder)
-            assert asset_info is not None, "Folder should exist after creation"
-            assert asset_info['type'] == 'FOLDER', "Asset should be of type FOLDER"
-            assert test_folder in asset_info['name'], "Asset name should match test folder path"
-
-            # Second call should find existing folder
-            result = ee_rle.create_asset_folder(test_folder)
-            assert result is False, "Second call should find existing folder and return False"
-
-        finally:
-            # Clean up: delete the test folder
-            try:
-                ee.data.deleteAsset(test_folder)
-            except Exception:
-                pass  # Ignore errors during cleanup
+        test_folder = f'projects/goog-rle-assessments/assets/test_create_folder_{unique_asset_suffix()}'
+        asset_registry.add(test_folder)
+
+        # First call should create the folder
+        result = ee_rle.create_asset_folder(test_folder)
+        assert result is True, "First call should create folder and return True"
+
+        # Verify folder was actually created by checking it exists
+        asset_info = ee.data.getAsset(test_folder)
+        assert asset_info is not None, "Folder should exist after creation"
+        assert asset_info['type'] == 'FOLDER', "Asset should be of type FOLDER"
+        assert test_folder in asset_info['name'], "Asset name should match test folder path"
+
+        # Second call should find existing folder
+        result = ee_rle.create_asset_folder(test_folder)
+        assert result is False, "Second call should find existing folder and return False"
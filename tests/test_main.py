@@ -1,7 +1,8 @@
 import pytest
 from typer.testing import CliRunner
 from unittest.mock import patch
-from gee_redlist.main import app
+from gee_redlist import __version__, main
+from gee_redlist.main import app, run
 
 runner = CliRunner()
 
@@ -23,10 +24,10 @@ def test_main_help():
 
 
 
-@patch('gee_redlist.main.print_authentication_status')
+@patch('gee_redlist.ee_auth.print_authentication_status')
 def test_test_auth_command(mock_print_auth):
     """Test that test-auth command calls print_authentication_status."""
-    result = runner.invoke(app, ["test-auth"])
+    result = runner.invoke(app, ["test-auth"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Testing Earth Engine authentication..." in result.stdout
     mock_print_auth.assert_called_once()
@@ -37,3 +38,33 @@ def test_test_auth_help():
     result = runner.invoke(app, ["test-auth", "--help"])
     assert result.exit_code == 0
     assert "Test Earth Engine authentication status" in result.stdout
+
+
+def test_run_no_command_fast_path(capsys):
+    """Test that run() without arguments prints the welcome message."""
+    run([])
+    captured = capsys.readouterr()
+    assert "Hello from gee-redlist-python!" in captured.out
+    assert "Use --help to see available commands" in captured.out
+
+
+def test_run_version_fast_path(capsys):
+    """Test that run() handles --version without the Typer app."""
+    run(["--version"])
+    captured = capsys.readouterr()
+    assert f"gee-redlist-python version {__version__}" in captured.out
+
+
+def test_version_option():
+    """Test that --version is also handled by the Typer app."""
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert f"gee-redlist-python version {__version__}" in result.stdout
+
+
+def test_run_reuses_app():
+    """Test that run() dispatches to the cached Typer app instead of rebuilding it."""
+    with patch.object(main, "_build_app") as mock_build:
+        with pytest.raises(SystemExit):
+            run(["--help"])
+    mock_build.assert_not_called()
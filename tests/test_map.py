@@ -2,17 +2,72 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import tempfile
 import os
-import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
-from PIL import Image
-from io import BytesIO
 from shapely.geometry import box
+import cartopy.crs as ccrs
+import matplotlib.colors
+import numpy as np
+import pyproj
 import shapely
 
-from gee_redlist.map import create_country_map, get_utm_proj_without_limits
+from gee_redlist import map as gee_map
+from gee_redlist.ee_auth import initialize_ee
+from gee_redlist.map import (
+    _get_figure,
+    _get_transformer,
+    _to_rgba,
+    _transform_geometry,
+    create_country_map,
+    create_country_maps,
+    get_utm_proj_without_limits,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_country_geometry_cache():
+    """Start every test without cached country geometries (wkls is mocked per test)."""
+    gee_map._load_country_geometry.cache_clear()
+    yield
+    gee_map._load_country_geometry.cache_clear()
+
+
+@pytest.fixture
+def mock_wkls(monkeypatch):
+    """Replace wkls with a mock serving the COUNTRY_WKB boundaries by country code."""
+    def lookup(country_code):
+        country = Mock()
+        wkb = COUNTRY_WKB.get(country_code.upper())
+        if wkb is None:
+            country.wkb.side_effect = ValueError(f"No result found for: {country_code}")
+        else:
+            country.wkb.return_value = wkb
+        return country
+
+    mock_wkls = MagicMock()
+    mock_wkls.__getitem__.side_effect = lookup
+    monkeypatch.setattr(gee_map, 'wkls', mock_wkls)
+    return mock_wkls
+
+
+@pytest.fixture
+def mock_figure():
+    """Patch the reusable map figure with a mock and return (mock_fig, mock_ax)."""
+    mock_fig = Mock()
+    mock_ax = Mock()
+    mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
+    mock_fig.add_subplot.return_value = mock_ax
+    with patch('gee_redlist.map._get_figure', return_value=mock_fig):
+        yield mock_fig, mock_ax
+
+
+@functools.lru_cache(maxsize=None)
+def utm_transformer(utm_zone, is_south):
+    """Helper function to get a cached WGS84 to UTM transformer (lon/lat axis order)."""
+    epsg = (32700 if is_south else 32600) + utm_zone
+    return pyproj.Transformer.from_crs('EPSG:4326', f'EPSG:{epsg}', always_xy=True)
 
 
 def create_mock_wkb_for_bounds(bounds):
@@ -21,388 +76,381 @@ def create_mock_wkb_for_bounds(bounds):
     return shapely.to_wkb(geom)
 
 
+# Bounds (minx, miny, maxx, maxy) of the countries mapped in the tests
+COUNTRY_BOUNDS = {
+    'SG': (103.6, 1.2, 104.0, 1.5),
+    'NZ': (166.0, -47.0, 179.0, -34.0),
+    'JP': (129.0, 31.0, 146.0, 46.0),
+    'BR': (-74.0, -34.0, -34.0, 5.0),
+    'FR': (-5.0, 41.0, 10.0, 51.0),
+    'KE': (33.9, -4.7, 41.9, 4.6),
+    'IS': (-24.5, 63.3, -13.5, 66.5),
+    'NP': (80.0, 26.3, 88.2, 30.4),
+    'PE': (-81.4, -18.3, -68.7, -0.0),
+}
+
+# Mock wkls boundaries for these countries, encoded once for all tests
+COUNTRY_WKB = {code: create_mock_wkb_for_bounds(bounds) for code, bounds in COUNTRY_BOUNDS.items()}
+
+
 class TestCreateCountryMap:
     """Tests for the create_country_map function."""
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_basic_map_creation(self, mock_plt, mock_wkls):
+    def test_basic_map_creation(self, mock_wkls, mock_figure, tmp_path):
         """Test basic map creation with default parameters."""
-        # Setup mocks
-        bounds = (103.6, 1.2, 104.0, 1.5)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+        mock_fig, mock_ax = mock_figure
 
         # Create temporary file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'test_map.png')
+        output_path = str(tmp_path / 'test_map.png')
 
-            result = create_country_map('SG', output_path)
+        result = create_country_map('SG', output_path)
 
-            # Verify result
-            assert result == output_path
-            mock_plt.savefig.assert_called_once()
-            mock_plt.close.assert_called_once_with(mock_fig)
+        # Verify result
+        assert result == output_path
+        mock_fig.savefig.assert_called_once()
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_country_not_found(self, mock_plt, mock_wkls):
+    def test_country_not_found(self, mock_wkls, mock_figure):
         """Test that ValueError is raised when country code not found in database."""
-        # Mock wkls to raise ValueError when country not found
-        mock_wkls.__getitem__.return_value.wkb.side_effect = ValueError("No result found for: zz")
-
         with pytest.raises(ValueError, match="Country code 'ZZ' not found in database"):
             create_country_map('ZZ')
 
-    def test_invalid_country_code_empty_string(self):
-        """Test that ValueError is raised for empty string."""
-        with pytest.raises(ValueError, match="country_code cannot be empty"):
-            create_country_map('')
-
-    def test_invalid_country_code_whitespace(self):
-        """Test that ValueError is raised for whitespace."""
-        with pytest.raises(ValueError, match="country_code cannot be empty"):
-            create_country_map('  ')
-
-    def test_invalid_country_code_none(self):
-        """Test that TypeError is raised for None."""
-        with pytest.raises(TypeError, match="country_code must be a string"):
-            create_country_map(None)
-
-    def test_invalid_country_code_number(self):
-        """Test that TypeError is raised for number."""
-        with pytest.raises(TypeError, match="country_code must be a string"):
-            create_country_map(123)
-
-    def test_invalid_country_code_too_short(self):
-        """Test that ValueError is raised for single letter."""
-        with pytest.raises(ValueError, match="must be a 2-letter ISO 3166-1 alpha-2 code"):
-            create_country_map('U')
-
-    def test_invalid_country_code_too_long(self):
-        """Test that ValueError is raised for 3+ letters."""
-        with pytest.raises(ValueError, match="must be a 2-letter ISO 3166-1 alpha-2 code"):
-            create_country_map('USA')
-
-    def test_invalid_country_code_full_name(self):
-        """Test that ValueError is raised for full country names."""
-        with pytest.raises(ValueError, match="must be a 2-letter ISO 3166-1 alpha-2 code"):
-            create_country_map('Singapore')
-
-    def test_invalid_country_code_numbers(self):
-        """Test that ValueError is raised for numbers in code."""
-        with pytest.raises(ValueError, match="must be a 2-letter ISO 3166-1 alpha-2 code"):
-            create_country_map('U1')
-
-    def test_invalid_country_code_special_chars(self):
-        """Test that ValueError is raised for special characters."""
-        with pytest.raises(ValueError, match="must be a 2-letter ISO 3166-1 alpha-2 code"):
-            create_country_map('U$')
-
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_valid_lowercase_code(self, mock_plt, mock_wkls):
-        """Test that lowercase ISO codes are accepted and converted."""
-        # Setup mocks
-        bounds = (103.6, 1.2, 104.0, 1.5)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'test.png')
-            result = create_country_map('sg', output_path)
-            assert result == output_path
-
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_valid_uppercase_code(self, mock_plt, mock_wkls):
-        """Test that uppercase ISO codes are accepted."""
-        # Setup mocks
-        bounds = (103.6, 1.2, 104.0, 1.5)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'test.png')
-            result = create_country_map('SG', output_path)
-            assert result == output_path
-
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_default_output_path(self, mock_plt, mock_wkls):
+    @pytest.mark.parametrize("country_code, exception, message", [
+        ('', ValueError, "country_code cannot be empty"),  # empty string
+        ('  ', ValueError, "country_code cannot be empty"),  # whitespace
+        (None, TypeError, "country_code must be a string"),
+        (123, TypeError, "country_code must be a string"),
+        ('U', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # too short
+        ('USA', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # too long
+        ('Singapore', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # full name
+        ('U1', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # numbers
+        ('U$', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # special characters
+        ('ÉS', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # non-ASCII letters
+        ('US\n', ValueError, "must be a 2-letter ISO 3166-1 alpha-2 code"),  # trailing newline
+    ])
+    def test_invalid_country_code(self, country_code, exception, message):
+        """Test that invalid country codes raise a descriptive error."""
+        with pytest.raises(exception, match=message):
+            create_country_map(country_code)
+
+    @pytest.mark.parametrize("country_code", ["sg", "SG", "Sg", "sG"])
+    def test_case_insensitive_code(self, country_code, mock_wkls, mock_figure, tmp_path):
+        """Test that ISO codes are accepted in any letter case."""
+        output_path = str(tmp_path / 'test.png')
+        result = create_country_map(country_code, output_path)
+        assert result == output_path
+        mock_wkls.__getitem__.assert_called_once_with('sg')
+
+    def test_default_output_path(self, mock_wkls, mock_figure):
         """Test that default output path is generated correctly."""
-        # Setup mocks
-        bounds = (166.0, -47.0, 179.0, -34.0)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
-
         result = create_country_map('NZ')
 
         # Should generate 'nz.png'
         assert result == 'nz.png'
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_custom_colors(self, mock_plt, mock_wkls):
+    def test_custom_colors(self, mock_wkls, mock_figure, tmp_path):
         """Test map creation with custom fill and edge colors."""
-        # Setup mocks
-        bounds = (129.0, 31.0, 146.0, 46.0)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
+        mock_fig, mock_ax = mock_figure
 
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+        output_path = str(tmp_path / 'japan.png')
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'japan.png')
+        geometry_kwargs = {
+            'facecolor': '#ff6b6b',
+            'edgecolor': 'darkred',
+            'linewidth': 2.5
+        }
+        result = create_country_map('JP', output_path, geometry_kwargs=geometry_kwargs)
 
-            result = create_country_map(
-                'JP',
-                output_path,
-                geometry_kwargs={
-                    'facecolor': '#ff6b6b',
-                    'edgecolor': 'darkred',
-                    'linewidth': 2.5
-                },
-            )
-
-            # Verify the geometries were added with custom colors
-            mock_ax.add_geometries.assert_called_once()
-            call_kwargs = mock_ax.add_geometries.call_args[1]
-            assert call_kwargs['facecolor'] == '#ff6b6b'
-            assert call_kwargs['edgecolor'] == 'darkred'
-            assert call_kwargs['linewidth'] == 2.5
+        # Verify the geometries were added once, with the custom colors
+        calls = mock_ax.add_geometries.call_args_list
+        assert len(calls) == 1
+        _, call_kwargs = calls[0]
+        assert call_kwargs.items() >= geometry_kwargs.items()
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_no_border(self, mock_plt, mock_wkls):
+    def test_no_border(self, mock_wkls, mock_figure, tmp_path):
         """Test map creation with show_border=False."""
-        # Setup mocks
-        bounds = (-74.0, -34.0, -34.0, 5.0)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
+        mock_fig, mock_ax = mock_figure
+
+        output_path = str(tmp_path / 'brazil.png')
+
+        result = create_country_map(
+            'BR',
+            output_path,
+            show_border=False,
+            geometry_kwargs={
+                'edgecolor': None,
+                'linewidth': None
+            }
+        )
 
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+        # Verify add_geometries was called
+        mock_ax.add_geometries.assert_not_called()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'brazil.png')
+    def test_spines_hidden(self, mock_wkls, mock_figure, tmp_path):
+        """Test that plot frame spines are hidden."""
+        mock_fig, mock_ax = mock_figure
 
-            result = create_country_map(
-                'BR',
-                output_path,
-                show_border=False,
-                geometry_kwargs={
-                    'edgecolor': None,
-                    'linewidth': None
-                }
-            )
+        output_path = str(tmp_path / 'france.png')
 
-            # Verify add_geometries was called
-            mock_ax.add_geometries.assert_not_called()
+        result = create_country_map('FR', output_path)
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_spines_hidden(self, mock_plt, mock_wkls):
-        """Test that plot frame spines are hidden."""
-        # Setup mocks
-        bounds = (-5.0, 41.0, 10.0, 51.0)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
+        # Verify spines were hidden (frame/border removed)
+        for spine in mock_ax.spines.values():
+            spine.set_visible.assert_called_once_with(False)
 
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+    def test_custom_title(self, mock_wkls, mock_figure, tmp_path):
+        """Test map creation with custom title."""
+        mock_fig, mock_ax = mock_figure
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'france.png')
+        output_path = str(tmp_path / 'kenya.png')
 
-            result = create_country_map('FR', output_path)
+        result = create_country_map('KE', output_path, title='Kenya Wildlife')
 
-            # Verify spines were hidden (frame/border removed)
-            for spine in mock_ax.spines.values():
-                spine.set_visible.assert_called_once_with(False)
+        # Verify title was set
+        mock_ax.set_title.assert_called_once_with('Kenya Wildlife', fontsize=16, fontweight='bold')
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_custom_title(self, mock_plt, mock_wkls):
-        """Test map creation with custom title."""
-        # Setup mocks
-        bounds = (33.9, -4.7, 41.9, 4.6)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
+    def test_no_title(self, mock_wkls, mock_figure, tmp_path):
+        """Test map creation with empty title."""
+        mock_fig, mock_ax = mock_figure
 
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+        output_path = str(tmp_path / 'iceland.png')
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'kenya.png')
+        result = create_country_map('IS', output_path, title='')
 
-            result = create_country_map('KE', output_path, title='Kenya Wildlife')
+        # Verify title was not called
+        mock_ax.set_title.assert_not_called()
 
-            # Verify title was set
-            mock_plt.title.assert_called_once_with('Kenya Wildlife', fontsize=16, fontweight='bold')
+    def test_country_geometry_cached(self, mock_wkls, mock_figure, tmp_path):
+        """Test that the country boundary is only fetched once per country."""
+        create_country_map('SG', str(tmp_path / 'a.png'))
+        create_country_map('sg', str(tmp_path / 'b.png'))
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.plt')
-    def test_no_title(self, mock_plt, mock_wkls):
-        """Test map creation with empty title."""
-        # Setup mocks
-        bounds = (-24.5, 63.3, -13.5, 66.5)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
+        mock_wkls.__getitem__.assert_called_once_with('sg')
+
+    def test_border_simplified(self, mock_wkls, mock_figure, tmp_path, monkeypatch):
+        """Test that border vertices finer than the output resolution are dropped."""
+        # A densely sampled circle (~8000 vertices)
+        geom = shapely.Point(10.0, 45.0).buffer(2.0, quad_segs=2000)
+        monkeypatch.setitem(COUNTRY_WKB, 'IT', shapely.to_wkb(geom))
+
+        mock_fig, mock_ax = mock_figure
+
+        output_path = str(tmp_path / 'circle.png')
+
+        create_country_map('IT', output_path)
+
+        border = mock_ax.add_geometries.call_args[0][0][0]
+        assert shapely.get_num_coordinates(border) < shapely.get_num_coordinates(geom) / 4
+
+    @patch('gee_redlist.map._warped_stock_image')
+    def test_stock_img(self, mock_warped_stock_image, mock_wkls, mock_figure, tmp_path):
+        """Test that the cached, pre-warped stock image is drawn when requested."""
+        stock_img = np.zeros((2, 2, 4))
+        stock_extent = (-1.0, 1.0, -1.0, 1.0)
+        mock_warped_stock_image.return_value = (stock_img, stock_extent)
+
+        mock_fig, mock_ax = mock_figure
 
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
+        output_path = str(tmp_path / 'iceland.png')
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'iceland.png')
+        create_country_map('IS', output_path, show_stock_img=True)
 
-            result = create_country_map('IS', output_path, title='')
+        # Iceland's centroid is in UTM zone 27N
+        mock_warped_stock_image.assert_called_once_with(27, False)
+        mock_ax.imshow.assert_called_once()
+        assert mock_ax.imshow.call_args[0][0] is stock_img
+        # Drawn in the map projection, so cartopy does not warp it again
+        imshow_kwargs = mock_ax.imshow.call_args[1]
+        assert imshow_kwargs['extent'] == stock_extent
+        assert imshow_kwargs['transform'] is mock_fig.add_subplot.call_args[1]['projection']
 
-            # Verify title was not called
-            mock_plt.title.assert_not_called()
+
+def create_mock_pixels(*bands):
+    """Helper function to create an ee.data.computePixels NUMPY_NDARRAY result from 2D bands."""
+    pixels = np.empty(bands[0].shape, dtype=[(f'b{i + 1}', band.dtype) for i, band in enumerate(bands)])
+    for i, band in enumerate(bands):
+        pixels[f'b{i + 1}'] = band
+    return pixels
 
 
 class TestEarthEngineBasemap:
     """Tests for Earth Engine basemap functionality."""
 
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.requests.get')
-    @patch('gee_redlist.map.plt')
-    def test_ee_image_basemap(self, mock_plt, mock_requests, mock_wkls):
+    def test_ee_image_basemap(self, mock_wkls, mock_figure, tmp_path):
         """Test map creation with Earth Engine image basemap."""
-        # Setup mocks
-        bounds = (80.0, 26.3, 88.2, 30.4)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
-
-        # Mock image response
-
-        test_image = Image.new('RGB', (100, 100), color='red')
-        img_bytes = BytesIO()
-        test_image.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-
-        mock_response = Mock()
-        mock_response.content = img_bytes.getvalue()
-        mock_requests.return_value = mock_response
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'nepal.png')
-
-            # Mock EE image
-            mock_ee_image = Mock()
-            mock_ee_image.getDownloadURL.return_value = 'http://example.com/image.png'
-            mock_mask = Mock()
-            mock_mask.getDownloadURL.return_value = 'http://example.com/mask.png'
-            mock_ee_image.mask.return_value = mock_mask
-
-            with patch('gee_redlist.map.ee') as mock_ee:
-                # Mock ee.Projection and ee.Geometry.Rectangle
-                mock_ee.Projection.return_value = Mock()
-                mock_ee.Geometry.Rectangle.return_value = Mock()
-
-                result = create_country_map(
-                    'NP',
-                    output_path,
-                    ee_image=mock_ee_image,
-                )
-
-                # Verify EE image methods were called
-                # The image should call getDownloadURL (not visualize)
-                mock_ee_image.getDownloadURL.assert_called()
-                mock_ee_image.mask.assert_called_once()
-                mock_mask.getDownloadURL.assert_called()
-
-                # Verify imshow was called to display the basemap
-                mock_ax.imshow.assert_called_once()
-
-    @patch('gee_redlist.map.wkls')
-    @patch('gee_redlist.map.requests.get')
-    @patch('gee_redlist.map.plt')
-    def test_ee_image_clipped(self, mock_plt, mock_requests, mock_wkls):
+        mock_fig, mock_ax = mock_figure
+
+        output_path = str(tmp_path / 'nepal.png')
+
+        # Mock EE image
+        mock_ee_image = Mock()
+        mock_displayed = mock_ee_image.select.return_value
+        mock_filled = mock_displayed.unmask.return_value
+
+        with patch('gee_redlist.map.ee') as mock_ee:
+            # A red RGB image
+            red = np.ones((100, 100), dtype=np.float32)
+            black = np.zeros((100, 100), dtype=np.float32)
+            mock_ee.data.computePixels.return_value = create_mock_pixels(red, black, black)
+
+            result = create_country_map(
+                'NP',
+                output_path,
+                ee_image=mock_ee_image,
+            )
+
+            # Verify masked pixels are filled in, so a single band set is requested
+            mock_displayed.unmask.assert_called_once_with(
+                gee_map._MASKED_VALUE, sameFootprint=False
+            )
+            mock_ee.data.computePixels.assert_called_once()
+            params = mock_ee.data.computePixels.call_args[0][0]
+            assert params['expression'] is mock_filled
+            assert params['fileFormat'] == 'NUMPY_NDARRAY'
+
+            # The image grid is a whole multiple of the output pixel size,
+            # anchored at the map's corner and covering the whole map
+            map_xlim = mock_ax.set_xlim.call_args[0]
+            map_ylim = mock_ax.set_ylim.call_args[0]
+            pixel_size = (map_xlim[1] - map_xlim[0]) / (
+                mock_fig.set_size_inches.call_args[0][0] * 150
+            )
+            transform = params['grid']['affineTransform']
+            image_scale = transform['scaleX']
+            assert transform['scaleY'] == -image_scale
+            assert image_scale / pixel_size == pytest.approx(round(image_scale / pixel_size))
+            assert transform['translateX'] == pytest.approx(map_xlim[0])
+            dimensions = params['grid']['dimensions']
+            assert transform['translateX'] + dimensions['width'] * image_scale >= map_xlim[1]
+            assert transform['translateY'] - dimensions['height'] * image_scale == pytest.approx(map_ylim[0])
+            assert transform['translateY'] >= map_ylim[1]
+            assert params['grid']['crsCode'] == 'EPSG:32645'
+
+            # Verify imshow was called to display the basemap as RGBA
+            mock_ax.imshow.assert_called_once()
+            rgba = mock_ax.imshow.call_args[0][0]
+            assert rgba.dtype == np.uint8
+            assert rgba.shape == (100, 100, 4)
+            assert tuple(rgba[0, 0]) == (255, 0, 0, 255)
+            # The raster is drawn in the axes projection without smoothing
+            imshow_kwargs = mock_ax.imshow.call_args[1]
+            assert imshow_kwargs['transform'] is mock_fig.add_subplot.call_args[1]['projection']
+            assert imshow_kwargs['interpolation'] == 'nearest'
+            assert imshow_kwargs['extent'][0] == transform['translateX']
+            assert imshow_kwargs['extent'][3] == transform['translateY']
+
+    def test_ee_image_extra_bands_skipped(self, mock_wkls, mock_figure, tmp_path):
+        """Test that only the displayed bands are requested and masked pixels are hidden."""
+        mock_fig, mock_ax = mock_figure
+
+        # The first three image bands (0.25, 0.5, 0.75), with one masked pixel
+        bands = [np.full((10, 10), value, dtype=np.float32) for value in (0.25, 0.5, 0.75)]
+        bands[1][5, 5] = gee_map._MASKED_VALUE
+
+        mock_ee_image = Mock()
+        output_path = str(tmp_path / 'nepal.png')
+
+        with patch('gee_redlist.map.ee') as mock_ee:
+            mock_ee.data.computePixels.return_value = create_mock_pixels(*bands)
+            create_country_map('NP', output_path, ee_image=mock_ee_image)
+
+        # At most three bands are selected server-side, before the pixels are computed
+        mock_ee_image.bandNames.return_value.slice.assert_called_once_with(0, 3)
+        mock_ee_image.select.assert_called_once_with(
+            mock_ee_image.bandNames.return_value.slice.return_value
+        )
+        expression = mock_ee.data.computePixels.call_args[0][0]['expression']
+        assert expression is mock_ee_image.select.return_value.unmask.return_value
+
+        rgba = mock_ax.imshow.call_args[0][0]
+        assert tuple(rgba[0, 0]) == (63, 127, 191, 255)
+        assert rgba[5, 5, 3] == 0
+
+    def test_ee_image_integer_rgb(self, mock_wkls, mock_figure, tmp_path):
+        """Test that integer RGB images keep their type and are drawn as 0-255 values."""
+        mock_fig, mock_ax = mock_figure
+
+        # e.g. ee.Image.visualize() output, widened to fit the sentinel
+        bands = [np.full((10, 10), value, dtype=np.int32) for value in (200, 100, 0)]
+        bands[0][5, 5] = gee_map._MASKED_VALUE
+
+        mock_ee_image = Mock()
+        output_path = str(tmp_path / 'nepal.png')
+
+        with patch('gee_redlist.map.ee') as mock_ee:
+            mock_ee.data.computePixels.return_value = create_mock_pixels(*bands)
+            create_country_map('NP', output_path, ee_image=mock_ee_image)
+
+        mock_ee_image.select.return_value.toFloat.assert_not_called()
+        rgba = mock_ax.imshow.call_args[0][0]
+        assert tuple(rgba[0, 0]) == (200, 100, 0, 255)
+        assert rgba[5, 5, 3] == 0
+
+    def test_ee_image_quantized(self, mock_wkls, mock_figure, tmp_path):
+        """Test that a quantized image is downloaded as bytes and drawn with its values."""
+        mock_fig, mock_ax = mock_figure
+
+        # A binary image quantized to 0 and 254, with one masked pixel (255)
+        band = np.zeros((10, 10), dtype=np.uint8)
+        band[:5] = 254
+        band[9, 9] = 255
+
+        mock_ee_image = Mock()
+
+        output_path = str(tmp_path / 'nepal.png')
+
+        with patch('gee_redlist.map.ee') as mock_ee:
+            mock_ee.data.computePixels.return_value = create_mock_pixels(band)
+            create_country_map('NP', output_path, ee_image=mock_ee_image, image_quantize=True)
+
+        # Values are scaled to bytes server-side, with 255 for masked pixels
+        mock_displayed = mock_ee_image.select.return_value
+        mock_displayed.unitScale.assert_called_once_with(0, 1)
+        mock_displayed.toFloat.assert_not_called()
+        to_uint8 = mock_displayed.unitScale.return_value.clamp.return_value.multiply.return_value.round.return_value.toUint8
+        to_uint8.return_value.unmask.assert_called_once_with(255, sameFootprint=False)
+
+        # 0 and 254 are recognised as a binary image ('binary' colormap)
+        rgba = mock_ax.imshow.call_args[0][0]
+        assert tuple(rgba[0, 0]) == (0, 0, 0, 255)
+        assert tuple(rgba[9, 0]) == (255, 255, 255, 255)
+        assert rgba[9, 9, 3] == 0
+
+    def test_ee_image_clipped(self, mock_wkls, mock_figure, tmp_path):
         """Test map creation with clipped Earth Engine image."""
-        # Setup mocks
-        bounds = (-81.4, -18.3, -68.7, -0.0)
-        mock_wkls.__getitem__.return_value.wkb.return_value = create_mock_wkb_for_bounds(bounds)
-
-        mock_fig = Mock()
-        mock_ax = Mock()
-        mock_ax.spines = {'top': Mock(), 'bottom': Mock(), 'left': Mock(), 'right': Mock()}
-        mock_plt.figure.return_value = mock_fig
-        mock_fig.add_subplot.return_value = mock_ax
-
-        # Mock image response
-
-        test_image = Image.new('RGB', (100, 100), color='blue')
-        img_bytes = BytesIO()
-        test_image.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-
-        mock_response = Mock()
-        mock_response.content = img_bytes.getvalue()
-        mock_requests.return_value = mock_response
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, 'peru.png')
-
-            # Mock EE image
-            mock_ee_image = Mock()
-            mock_clipped = Mock()
-            mock_clipped.getDownloadURL.return_value = 'http://example.com/image.png'
-            mock_ee_image.clip.return_value = mock_clipped
-
-            with patch('gee_redlist.map.ee') as mock_ee:
-                # Mock ee.Projection, ee.Geometry, and ee.Geometry.Rectangle
-                mock_ee.Projection.return_value = Mock()
-                mock_ee_geom = Mock()
-                mock_ee.Geometry.return_value = mock_ee_geom
-                mock_ee.Geometry.Rectangle.return_value = Mock()
-
-                result = create_country_map(
-                    'PE',
-                    output_path,
-                    ee_image=mock_ee_image,
-                    clip_ee_image=True
-                )
-
-                # Verify clip was called
-                mock_ee_image.clip.assert_called_once()
+        mock_fig, mock_ax = mock_figure
+
+        output_path = str(tmp_path / 'peru.png')
+
+        # Mock EE image
+        mock_ee_image = Mock()
+
+        with patch('gee_redlist.map.ee') as mock_ee:
+            mock_ee_geom = Mock()
+            mock_ee.Geometry.return_value = mock_ee_geom
+            band = np.zeros((100, 100), dtype=np.float32)
+            mock_ee.data.computePixels.return_value = create_mock_pixels(band, band, band)
+
+            result = create_country_map(
+                'PE',
+                output_path,
+                ee_image=mock_ee_image,
+                clip_ee_image=True
+            )
+
+            # Verify clip was called with a planar lon/lat geometry
+            mock_ee_image.clip.assert_called_once_with(mock_ee_geom)
+            assert mock_ee.Geometry.call_args[0][1] == 'EPSG:4326'
+            assert mock_ee.Geometry.call_args[1] == {'geodesic': False}
+
+            # Only the country bounds (without the map padding) are requested,
+            # rounded out to whole image pixels
+            grid = mock_ee.data.computePixels.call_args[0][0]['grid']
+            image_scale = grid['affineTransform']['scaleX']
+            region_width = grid['dimensions']['width'] * image_scale
+            assert mock_ax.set_xlim.call_count == 1
+            map_xlim = mock_ax.set_xlim.call_args[0]
+            country_width = (map_xlim[1] - map_xlim[0]) / 1.3
+            assert country_width <= region_width <= country_width + 2 * image_scale
 
 
 class TestGetUtmProjWithoutLimits:
@@ -410,9 +458,6 @@ class TestGetUtmProjWithoutLimits:
 
     def test_northern_hemisphere_zone_13(self):
         """Test UTM Zone 13N projection parameters."""
-        import cartopy.crs as ccrs
-        import pyproj
-
         utm_zone = 13
         is_south = False
 
@@ -432,11 +477,7 @@ class TestGetUtmProjWithoutLimits:
 
         # Test by transforming a point at the expected central meridian
         # At the central meridian, easting should be 500,000 meters (false_easting)
-        transformer = pyproj.Transformer.from_crs(
-            'EPSG:4326',  # WGS84
-            f'EPSG:326{utm_zone}',  # UTM 13N
-            always_xy=True
-        )
+        transformer = utm_transformer(utm_zone, is_south)  # UTM 13N
 
         # Transform point at central meridian
         x, y = transformer.transform(expected_central_lon, 23.0)
@@ -460,9 +501,6 @@ class TestGetUtmProjWithoutLimits:
 
     def test_southern_hemisphere_zone_56(self):
         """Test UTM Zone 56S projection parameters."""
-        import cartopy.crs as ccrs
-        import pyproj
-
         utm_zone = 56
         is_south = True
 
@@ -476,11 +514,7 @@ class TestGetUtmProjWithoutLimits:
         expected_central_lon = (utm_zone - 1) * 6 - 180 + 3  # 153° for zone 56
 
         # Test by transforming a point at the expected central meridian
-        transformer = pyproj.Transformer.from_crs(
-            'EPSG:4326',  # WGS84
-            f'EPSG:327{utm_zone}',  # UTM 56S
-            always_xy=True
-        )
+        transformer = utm_transformer(utm_zone, is_south)  # UTM 56S
 
         # Transform point at central meridian (in southern hemisphere)
         x, y = transformer.transform(expected_central_lon, -33.0)
@@ -508,29 +542,24 @@ class TestGetUtmProjWithoutLimits:
             # The central longitude should match the expected value
             # We can verify this by checking that a point at this longitude
             # transforms to easting = 500,000
-            import pyproj
-            transformer = pyproj.Transformer.from_crs(
-                'EPSG:4326',
-                f'EPSG:326{utm_zone:02d}',
-                always_xy=True
-            )
+            transformer = utm_transformer(utm_zone, False)
 
             x, y = transformer.transform(expected_central_lon, 0.0)
             assert abs(x - 500000.0) < 1.0, \
                 f"Zone {utm_zone}: point at {expected_central_lon}° should have easting ~500000, got {x}"
 
+    def test_projection_is_cached(self):
+        """Test that the projection for a zone and hemisphere is only built once."""
+        assert get_utm_proj_without_limits(33, False) is get_utm_proj_without_limits(33, False)
+        assert get_utm_proj_without_limits(33, False) is not get_utm_proj_without_limits(33, True)
+
     def test_projection_equivalence(self):
         """Test that our custom projection produces same coordinates as standard UTM within limits."""
-        import pyproj
-
         utm_zone = 14
 
         # Create both projections
         custom_proj = get_utm_proj_without_limits(utm_zone, is_south=False)
 
-        # Create transformers using EPSG codes
-        custom_epsg = f'EPSG:326{utm_zone}'
-
         # Test several points within the standard UTM limits
         test_points = [
             (-102.0, 23.0),  # Near central meridian
@@ -538,7 +567,7 @@ class TestGetUtmProjWithoutLimits:
             (-104.0, 25.0),  # West of center
         ]
 
-        transformer = pyproj.Transformer.from_crs('EPSG:4326', custom_epsg, always_xy=True)
+        transformer = utm_transformer(utm_zone, False)
 
         for lon, lat in test_points:
             x, y = transformer.transform(lon, lat)
@@ -547,4 +576,141 @@ class TestGetUtmProjWithoutLimits:
             # Easting should be within valid UTM range
             assert -2000000 < x < 3000000, f"Easting {x} out of expected range"
             # Northing should be positive for northern hemisphere
-            assert 0 < y < 10000000, f"Northing {y} out of expected range"
\ No newline at end of file
+            assert 0 < y < 10000000, f"Northing {y} out of expected range"
+
+
+class TestGetUtmEpsgMany:
+    """Tests for the get_utm_epsg_many function."""
+
+    def test_matches_scalar_version(self):
+        """Test that every point gets the same EPSG code as get_utm_epsg."""
+        rng = np.random.default_rng(0)
+        lons = rng.uniform(-180, 180, 1000)
+        lats = rng.uniform(-90, 90, 1000)
+        lons[:3] = [-180, 180, 0]
+        lats[:3] = [0, -0.0, -1e-9]
+
+        result = gee_map.get_utm_epsg_many(lons, lats)
+
+        expected = [gee_map.get_utm_epsg(lon, lat) for lon, lat in zip(lons, lats)]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_known_cities(self):
+        """Test EPSG codes for points in both hemispheres."""
+        result = gee_map.get_utm_epsg_many([-122.4, 103.8, -43.2, 151.2], [37.8, 1.3, -22.9, -33.9])
+        assert result.tolist() == [32610, 32648, 32723, 32756]
+
+
+class TestTransformGeometry:
+    """Tests for the _transform_geometry helper."""
+
+    def test_matches_pyproj(self):
+        """Test that the vectorized transform matches a per-point pyproj transform."""
+        geom = box(103.6, 1.2, 104.0, 1.5)
+        transformed = _transform_geometry(geom, 32648)
+
+        transformer = pyproj.Transformer.from_crs('EPSG:4326', 'EPSG:32648', always_xy=True)
+        for (lon, lat), (x, y) in zip(geom.exterior.coords, transformed.exterior.coords):
+            expected_x, expected_y = transformer.transform(lon, lat)
+            assert abs(x - expected_x) < 1e-6
+            assert abs(y - expected_y) < 1e-6
+
+    def test_transformer_is_cached(self):
+        """Test that the transformer for a UTM zone is only created once."""
+        assert _get_transformer(32610) is _get_transformer(32610)
+
+
+class TestToRgba:
+    """Tests for the _to_rgba helper."""
+
+    def test_single_band_uses_colormap(self):
+        """Test that a single band is coloured with the colormap and masked via alpha."""
+        img = np.array([[[0.0], [1.0]]])
+        valid = np.array([[True, False]])
+
+        rgba = _to_rgba(img, valid, 'binary', 0, 1)
+
+        assert rgba.dtype == np.uint8
+        assert rgba.shape == (1, 2, 4)
+        # 'binary' maps 0 to white
+        assert tuple(rgba[0, 0]) == (255, 255, 255, 255)
+        # Invalid pixels are transparent
+        assert rgba[0, 1, 3] == 0
+
+    def test_multi_band_as_rgb(self):
+        """Test that multi-band images are treated as RGB in the 0-1 range."""
+        img = np.array([[[1.0, 0.0, 2.0]]])
+        valid = np.array([[True]])
+
+        rgba = _to_rgba(img, valid, 'grey', 0, 1)
+
+        assert tuple(rgba[0, 0]) == (255, 0, 255, 255)
+
+    def test_integer_rgb_used_as_is(self):
+        """Test that integer RGB images are treated as 0-255 values."""
+        img = np.array([[[200, 100, 0]]], dtype=np.uint8)
+        valid = np.array([[True]])
+
+        rgba = _to_rgba(img, valid, 'grey', 0, 1)
+
+        assert tuple(rgba[0, 0]) == (200, 100, 0, 255)
+
+    def test_colormap_object(self):
+        """Test that a Colormap object is accepted as well as a colormap name."""
+        img = np.array([[[0.0], [1.0]]])
+        valid = np.array([[True, True]])
+
+        rgba = _to_rgba(img, valid, matplotlib.colors.ListedColormap(['red']), 0, 1)
+
+        assert tuple(rgba[0, 0]) == (255, 0, 0, 255)
+        assert tuple(rgba[0, 1]) == (255, 0, 0, 255)
+
+
+class TestGetFigure:
+    """Tests for the _get_figure helper."""
+
+    def test_figure_is_reused_and_cleared(self):
+        """Test that the same figure is returned, without axes from the previous map."""
+        fig = _get_figure()
+        fig.add_subplot(1, 1, 1)
+
+        assert _get_figure() is fig
+        assert fig.axes == []
+
+    def test_one_figure_per_thread(self):
+        """Test that each thread draws on its own figure."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_fig = executor.submit(_get_figure).result()
+
+        assert other_thread_fig is not _get_figure()
+
+
+class TestCreateCountryMaps:
+    """Tests for the create_country_maps function."""
+
+    @patch('gee_redlist.map.create_country_map')
+    @patch('gee_redlist.map.ProcessPoolExecutor')
+    def test_maps_created_in_order(self, mock_executor_cls, mock_create):
+        """Test that each country is mapped to '{code}.png' in the output directory."""
+        # Threads instead of processes so the mocks are visible to the workers
+        mock_executor_cls.side_effect = ThreadPoolExecutor
+        mock_create.side_effect = lambda code, path, **kwargs: path
+
+        result = create_country_maps(['SG', 'FR'], 'maps', max_workers=2, dpi=100)
+
+        assert result == [os.path.join('maps', 'sg.png'), os.path.join('maps', 'fr.png')]
+        mock_executor_cls.assert_called_once_with(max_workers=2)
+        mock_create.assert_any_call('SG', os.path.join('maps', 'sg.png'), dpi=100)
+        mock_create.assert_any_call('FR', os.path.join('maps', 'fr.png'), dpi=100)
+
+    @patch('gee_redlist.map.create_country_map')
+    @patch('gee_redlist.map.ProcessPoolExecutor')
+    def test_ee_initialized_in_workers(self, mock_executor_cls, mock_create):
+        """Test that Earth Engine is initialized once per worker when a project is given."""
+        mock_executor_cls.return_value.__enter__.return_value.map.return_value = ['sg.png']
+
+        create_country_maps(['SG'], ee_project='my-project')
+
+        mock_executor_cls.assert_called_once_with(
+            max_workers=None, initializer=initialize_ee, initargs=('my-project', True)
+        )